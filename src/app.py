@@ -1,7 +1,5 @@
 from __future__ import annotations
 import typer
-from .flows.new_project_flow import run_new_project
-from .flows.iterate_flow import run_iterate
 
 
 app = typer.Typer(help="CrewAI Python Dev Starter CLI")
@@ -15,7 +13,11 @@ def new_project(
     out: str = typer.Option(..., "--out", help="Output directory for the new project"),
 ):
     """Greenfield: generate a brand new project from a short prompt."""
+    from .flows.new_project_flow import run_new_project
+    from .utils.semantic_cache import save_warmup
+
     run_new_project(prompt, out)
+    save_warmup()
 
 
 @app.command("iterate")
@@ -26,30 +28,32 @@ def iterate(
     repo: str = typer.Option(..., "--repo", help="Path to existing repository"),
 ):
     """Iterate on an existing project: targeted changes with tests and knowledge updates."""
+    from .flows.iterate_flow import run_iterate
+    from .utils.semantic_cache import save_warmup
+
     run_iterate(prompt, repo)
+    save_warmup()
 
 
 @app.command("fmt")
 def fmt(repo: str = typer.Option(..., "--repo", help="Path to repo")):
     import subprocess
-    import shlex
 
-    subprocess.run(f"black {shlex.quote(repo)}", shell=True, check=False)
+    subprocess.run(["black", repo], check=False)
 
 
 @app.command("lint")
 def lint(repo: str = typer.Option(..., "--repo", help="Path to repo")):
     import subprocess
-    import shlex
 
-    subprocess.run(f"ruff {shlex.quote(repo)}", shell=True, check=False)
+    subprocess.run(["ruff", "check", repo], check=False)
 
 
 @app.command("test")
 def test(repo: str = typer.Option(..., "--repo", help="Path to repo")):
     import subprocess
 
-    subprocess.run("pytest -q", shell=True, cwd=repo, check=False)
+    subprocess.run(["pytest", "-q"], cwd=repo, check=False)
 
 
 if __name__ == "__main__":
@@ -1,10 +1,11 @@
 from __future__ import annotations
 from typing import Dict
 from pydantic import RootModel
+from ....utils.schemas import CachedSchemaMixin
 
 
 COPY_MAP_SCHEMA = '{"old_path": "new_path"}'
 
 
-class CopyMapOutput(RootModel[Dict[str, str]]):
+class CopyMapOutput(CachedSchemaMixin, RootModel[Dict[str, str]]):
     pass
@@ -7,6 +7,7 @@ from .bug_fixer_crew import (
     SeniorBugFixerCrew,
     LeadBugFixerCrew,
     bug_fixer_for_points,
+    bug_fixer_batch,
 )
 
 __all__ = [
@@ -18,4 +19,5 @@ __all__ = [
     "SeniorBugFixerCrew",
     "LeadBugFixerCrew",
     "bug_fixer_for_points",
+    "bug_fixer_batch",
 ]
@@ -1,6 +1,8 @@
 from __future__ import annotations
 from crewai import Task, Crew, Process
 from crewai.project import crew, task
+from ... import settings
+from ...utils.semantic_cache import CachedCrew
 from .crew import BaseDebugCrew
 from .output_format.bug_analysis import AnalyzeTestFailuresOutput
 
@@ -20,12 +22,12 @@ class BugAnalysisCrew(BaseDebugCrew):
 
     @crew
     def crew(self) -> Crew:
-        return Crew(
+        return CachedCrew(
             agents=[self.analyst()],
             tasks=[
                 self.analyze_test_failures(),
             ],
             process=Process.sequential,
-            output_log_file=True,
-            verbose=True,
+            output_log_file=settings.CREW_OUTPUT_LOG_FILE,
+            verbose=settings.CREW_VERBOSE,
         )
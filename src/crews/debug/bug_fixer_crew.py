@@ -1,6 +1,12 @@
 from __future__ import annotations
-from crewai import Task, Crew, Process
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, List, Optional
+import hashlib
+import orjson
+from crewai import Task, Crew, CrewOutput, Process
 from crewai.project import crew, task
+from ... import settings
+from ...utils.semantic_cache import CachedCrew
 from .crew import BaseDebugCrew
 from .output_format.bug_fixes import ImplementBugFixesOutput
 
@@ -21,12 +27,12 @@ class BaseBugFixerCrew(BaseDebugCrew):
 
     @crew
     def crew(self) -> Crew:
-        return Crew(
+        return CachedCrew(
             agents=[self.bug_fixer()],
             tasks=[self.implement_bug_fixes()],
             process=Process.sequential,
-            output_log_file=True,
-            verbose=True,
+            output_log_file=settings.CREW_OUTPUT_LOG_FILE,
+            verbose=settings.CREW_VERBOSE,
         )
 
 
@@ -48,6 +54,10 @@ class LeadBugFixerCrew(BaseBugFixerCrew):
         self.llm_bug_fixer = self.llm_reasoning
 
 
+# Indexed by points, clamped to 1..3
+_BUG_FIXERS = (JuniorBugFixerCrew, JuniorBugFixerCrew, SeniorBugFixerCrew, LeadBugFixerCrew)
+
+
 def bug_fixer_for_points(points: int) -> BaseBugFixerCrew:
     """Select crew according to the bug's points.
 
@@ -55,8 +65,50 @@ def bug_fixer_for_points(points: int) -> BaseBugFixerCrew:
     - 2 points: SeniorBugFixerCrew
     - 3 points or more: LeadBugFixerCrew
     """
-    if points <= 1:
-        return JuniorBugFixerCrew()
-    if points == 2:
-        return SeniorBugFixerCrew()
-    return LeadBugFixerCrew()
+    return _BUG_FIXERS[min(max(points, 1), 3)]()
+
+
+def _bug_key(bug: Dict[str, Any]) -> bytes:
+    """Canonical hash of a bug, ignoring its id and effort estimate."""
+    payload = {k: v for k, v in bug.items() if k not in ("id", "points")}
+    data = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS, default=str)
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def bug_fixer_batch(
+    bugs: List[Dict[str, Any]],
+    debug_info: Dict[str, Any],
+    max_workers: Optional[int] = None,
+) -> List[CrewOutput]:
+    """Run the bug fixer crew of every bug concurrently.
+
+    Identical bugs (same content apart from id and points) are fixed once, by
+    the crew matching the highest points among them, and share the output.
+    Each crew run gets its own instance (and therefore its own agents and task
+    state), so kickoffs can overlap safely. Results keep the order of ``bugs``.
+    """
+    if not bugs:
+        return []
+
+    groups: Dict[bytes, List[int]] = {}
+    for i, bug in enumerate(bugs):
+        groups.setdefault(_bug_key(bug), []).append(i)
+
+    def _fix(indexes: List[int]) -> CrewOutput:
+        points = max(int(bugs[i].get("points", 1) or 1) for i in indexes)
+        return bug_fixer_for_points(points).crew().kickoff(inputs={
+            "bug": bugs[indexes[0]],
+            "debug_info": debug_info,
+        })
+
+    unique = list(groups.values())
+
+    workers = max(1, min(max_workers or settings.MAX_CONCURRENT_CREWS, len(unique)))
+    results: List[Optional[CrewOutput]] = [None] * len(bugs)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(_fix, indexes): indexes for indexes in unique}
+        for future in as_completed(futures):
+            output = future.result()
+            for i in futures[future]:
+                results[i] = output
+    return results  # type: ignore[return-value]
@@ -3,9 +3,13 @@ from typing import List
 from crewai import Agent, Task
 from crewai.project import CrewBase, agent
 from crewai.agents.agent_builder.base_agent import BaseAgent
-from ...utils.routing import llms
+from ... import settings
+from ...utils.routing import get_llm
+from ...utils.semantic_cache import warmup_once
+from ...utils.crew_config import cached_configs
 
 
+@cached_configs
 @CrewBase
 class BaseDebugCrew:
     """
@@ -16,11 +20,12 @@ class BaseDebugCrew:
     tasks: List[Task]
 
     def __init__(self):
-        self.llm_light = llms()["light"]
-        self.llm_medium = llms()["medium"]
-        self.llm_reasoning = llms()["reasoning"]
+        warmup_once()
+        self.llm_light = get_llm("light")
+        self.llm_medium = get_llm("medium")
+        self.llm_reasoning = get_llm("reasoning")
 
-        self.llm_bug_fixer = llms()["light"]
+        self.llm_bug_fixer = get_llm("light")
 
     # Agents
     @agent
@@ -28,7 +33,7 @@ class BaseDebugCrew:
         return Agent(
             config=self.agents_config["reporter"],  # type: ignore[index]
             llm=self.llm_light,
-            verbose=True,
+            verbose=settings.CREW_VERBOSE,
         )
 
     @agent
@@ -36,7 +41,7 @@ class BaseDebugCrew:
         return Agent(
             config=self.agents_config["grouper"],  # type: ignore[index]
             llm=self.llm_medium,
-            verbose=True,
+            verbose=settings.CREW_VERBOSE,
         )
 
     # Agents
@@ -45,7 +50,7 @@ class BaseDebugCrew:
         return Agent(
             config=self.agents_config["analyst"],  # type: ignore[index]
             llm=self.llm_reasoning,
-            verbose=True,
+            verbose=settings.CREW_VERBOSE,
         )
 
     # Agents
@@ -54,5 +59,5 @@ class BaseDebugCrew:
         return Agent(
             config=self.agents_config["bug_fixer"],  # type: ignore[index]
             llm=self.llm_bug_fixer,
-            verbose=True,
+            verbose=settings.CREW_VERBOSE,
         )
@@ -1,6 +1,7 @@
 from __future__ import annotations
 from typing import List, Optional
-from pydantic import BaseModel, RootModel
+from pydantic import RootModel
+from ....utils.schemas import CachedSchemaMixin, FrozenModel
 
 
 INVOLVED_FILES_SCHEMA = '''
@@ -15,7 +16,7 @@ INVOLVED_FILES_SCHEMA = '''
 '''
 
 
-class InvolvedFilesItem(BaseModel):
+class InvolvedFilesItem(FrozenModel):
     file_path: List[Optional[str]]
     affected_callable: List[Optional[str]]
     error: List[str]
@@ -23,5 +24,5 @@ class InvolvedFilesItem(BaseModel):
     involved_files: List[str]
     id: int
 
-class AnalyzeInvolvedFilesOutput(RootModel[List[InvolvedFilesItem]]):
+class AnalyzeInvolvedFilesOutput(CachedSchemaMixin, RootModel[List[InvolvedFilesItem]]):
     pass
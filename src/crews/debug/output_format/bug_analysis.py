@@ -1,6 +1,7 @@
 from __future__ import annotations
 from typing import List
-from pydantic import BaseModel, RootModel
+from pydantic import RootModel
+from ....utils.schemas import CachedSchemaMixin, FrozenModel
 
 
 BUG_ANALYSIS_SCHEMA = '''
@@ -15,7 +16,7 @@ BUG_ANALYSIS_SCHEMA = '''
 '''
 
 
-class BugAnalysisItem(BaseModel):
+class BugAnalysisItem(FrozenModel):
     file_paths: List[str]
     affected_callables: List[str]
     points: int
@@ -23,5 +24,5 @@ class BugAnalysisItem(BaseModel):
     fix: str
     id: int
 
-class AnalyzeTestFailuresOutput(RootModel[List[BugAnalysisItem]]):
+class AnalyzeTestFailuresOutput(CachedSchemaMixin, RootModel[List[BugAnalysisItem]]):
     pass
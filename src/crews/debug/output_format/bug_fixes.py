@@ -1,6 +1,7 @@
 from __future__ import annotations
 from typing import List
-from pydantic import BaseModel, RootModel
+from pydantic import RootModel
+from ....utils.schemas import CachedSchemaMixin, FrozenModel
 
 
 BUG_FIXES_SCHEMA = '''
@@ -11,10 +12,10 @@ BUG_FIXES_SCHEMA = '''
 '''
 
 
-class BugFixFile(BaseModel):
+class BugFixFile(FrozenModel):
     path: str
     content_diff: str
 
 
-class ImplementBugFixesOutput(RootModel[List[BugFixFile]]):
+class ImplementBugFixesOutput(CachedSchemaMixin, RootModel[List[BugFixFile]]):
     pass
@@ -1,6 +1,7 @@
 from __future__ import annotations
 from typing import List, Optional
-from pydantic import BaseModel, RootModel
+from pydantic import RootModel
+from ....utils.schemas import CachedSchemaMixin, FrozenModel
 
 
 PYTEST_OUTPUT_ANALYSIS_SCHEMA = '''
@@ -13,12 +14,12 @@ PYTEST_OUTPUT_ANALYSIS_SCHEMA = '''
 '''
 
 
-class GroupedFailure(BaseModel):
+class GroupedFailure(FrozenModel):
     file_path: Optional[str] = None
     affected_callable: Optional[str] = None
     error: List[str]
     traceback: List[str]
 
 
-class GroupFailuresByRootCause(RootModel[List[GroupedFailure]]):
+class GroupFailuresByRootCause(CachedSchemaMixin, RootModel[List[GroupedFailure]]):
     pass
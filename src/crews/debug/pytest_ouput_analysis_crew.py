@@ -1,8 +1,10 @@
 from __future__ import annotations
 from crewai import Task, Crew, Process
+from ... import settings
 from ...flows.utils import is_something_to_fix
 from crewai.tasks.conditional_task import ConditionalTask
 from crewai.project import crew, task
+from ...utils.semantic_cache import CachedCrew
 from .crew import BaseDebugCrew
 from .output_format.pytest_output import GroupFailuresByRootCause
 
@@ -28,13 +30,13 @@ class PytestOutputAnalysisCrew(BaseDebugCrew):
 
     @crew
     def crew(self) -> Crew:
-        return Crew(
+        return CachedCrew(
             agents=[self.reporter(), self.grouper()],
             tasks=[
                 self.parse_pytest_output(),
                 self.group_failures_by_root_cause(),
             ],
             process=Process.sequential,
-            output_log_file=True,
-            verbose=True,
+            output_log_file=settings.CREW_OUTPUT_LOG_FILE,
+            verbose=settings.CREW_VERBOSE,
         )
@@ -3,10 +3,13 @@ from typing import List
 from crewai import Agent, Task, Crew, Process
 from crewai.project import CrewBase, agent, crew, task
 from crewai.agents.agent_builder.base_agent import BaseAgent
-from ...utils.routing import llms
+from ... import settings
+from ...utils.routing import get_llm
+from ...utils.crew_config import cached_configs
 from .output_format.task_assignment import TaskAssignmentOutput
 
 
+@cached_configs
 @CrewBase
 class ProjectDesignCrew:
     """
@@ -17,9 +20,9 @@ class ProjectDesignCrew:
     tasks: List[Task]
 
     def __init__(self):
-        self.llm_light = llms()["light"]
-        self.llm_medium = llms()["medium"]
-        self.llm_reasoning = llms()["reasoning"]
+        self.llm_light = get_llm("light")
+        self.llm_medium = get_llm("medium")
+        self.llm_reasoning = get_llm("reasoning")
 
     # Agents
     @agent
@@ -27,7 +30,7 @@ class ProjectDesignCrew:
         return Agent(
             config=self.agents_config["requirements_analyst"],  # type: ignore[index]
             llm=self.llm_medium,
-            verbose=True,
+            verbose=settings.CREW_VERBOSE,
         )
 
     @agent
@@ -35,7 +38,7 @@ class ProjectDesignCrew:
         return Agent(
             config=self.agents_config["software_architect"],  # type: ignore[index]
             llm=self.llm_reasoning,
-            verbose=True,
+            verbose=settings.CREW_VERBOSE,
         )
 
     @agent
@@ -43,7 +46,7 @@ class ProjectDesignCrew:
         return Agent(
             config=self.agents_config["project_manager"],  # type: ignore[index]
             llm=self.llm_medium,
-            verbose=True,
+            verbose=settings.CREW_VERBOSE,
         )
 
     # Tasks
@@ -77,6 +80,6 @@ class ProjectDesignCrew:
                 self.task_assignment(),
             ],
             process=Process.sequential,
-            output_log_file=True,
-            verbose=True,
+            output_log_file=settings.CREW_OUTPUT_LOG_FILE,
+            verbose=settings.CREW_VERBOSE,
         )
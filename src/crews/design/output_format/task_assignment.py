@@ -1,6 +1,8 @@
 from __future__ import annotations
 from typing import List, Dict
-from pydantic import BaseModel, Field, RootModel
+from pydantic import Field, RootModel
+from typing_extensions import TypedDict
+from ....utils.schemas import CachedSchemaMixin, FrozenModel
 
 
 TASK_ASSIGNMENT_SCHEMA = '''
@@ -32,19 +34,21 @@ TASK_ASSIGNMENT_SCHEMA = '''
     }]
 '''
 
-class Parameter(BaseModel):
+# The most numerous record of a design: validated into a plain dict instead of
+# a model instance (no per-instance __dict__/fields-set bookkeeping); dumps the same.
+class Parameter(TypedDict):
     name: str
     type: str
 
 
-class Method(BaseModel):
+class Method(FrozenModel):
     name: str
     parameters: List[Parameter] = Field(default_factory=list)
     functionalities: List[str] = Field(default_factory=list)
     points: int
 
 
-class ClassSpec(BaseModel):
+class ClassSpec(FrozenModel):
     name: str
     methods: List[Method] = Field(default_factory=list)
     parameters: List[Parameter] = Field(default_factory=list)
@@ -52,23 +56,23 @@ class ClassSpec(BaseModel):
     points: int
 
 
-class FunctionSpec(BaseModel):
+class FunctionSpec(FrozenModel):
     name: str
     parameters: List[Parameter] = Field(default_factory=list)
     functionalities: List[str] = Field(default_factory=list)
     points: int
 
 
-class FileSpec(BaseModel):
+class FileSpec(FrozenModel):
     project_dependencies: List[str] = Field(default_factory=list)
     classes: List[ClassSpec] = Field(default_factory=list)
     functions: List[FunctionSpec] = Field(default_factory=list)
 
 
-class Assignment(BaseModel):
+class Assignment(FrozenModel):
     developer: int
     set_of_files: Dict[str, FileSpec]
 
 
-class TaskAssignmentOutput(RootModel[List[Assignment]]):
+class TaskAssignmentOutput(CachedSchemaMixin, RootModel[List[Assignment]]):
     pass
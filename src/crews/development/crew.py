@@ -1,20 +1,23 @@
 from __future__ import annotations
+from functools import partial
 from typing import List
-from crewai import Agent, Task, Crew, Process, TaskOutput
+from crewai import Agent, Task, Crew, Process
 from crewai.tasks.conditional_task import ConditionalTask
 from crewai.project import CrewBase, agent, crew, task
 from crewai.agents.agent_builder.base_agent import BaseAgent
-from ...utils.routing import llms
+from ... import settings
+from ...utils.routing import get_llm
+from ...utils.semantic_cache import CachedCrew
+from ...utils.crew_config import cached_configs
+from ...flows.utils import is_something_to_fix
 from .output_format.generate_code import GenerateCodeOutput
 from .output_format.debug_if_needed import DebugIfNeededOutput
 
 
-def is_something_to_fix(output: TaskOutput) -> bool:
-    # "[]" is not a valid output
-    output = str(output)
-    return len(output) > 2  and '{' in output and '}' in output and 'fix' in output
+has_fixes = partial(is_something_to_fix, required_token='fix')
 
 
+@cached_configs
 @CrewBase
 class JuniorDevelopmentCrew:
     """
@@ -26,20 +29,20 @@ class JuniorDevelopmentCrew:
     tasks: List[Task]
 
     def __init__(self):
-        self.llm_light = llms()["light"]
-        self.llm_medium = llms()["medium"]
-        self.llm_reasoning = llms()["reasoning"]
+        self.llm_light = get_llm("light")
+        self.llm_medium = get_llm("medium")
+        self.llm_reasoning = get_llm("reasoning")
 
-        self.llm_developer = llms()["light"]
-        self.llm_reviewer = llms()["light"]
-        self.llm_debugger = llms()["light"]
+        self.llm_developer = get_llm("light")
+        self.llm_reviewer = get_llm("light")
+        self.llm_debugger = get_llm("light")
 
     @agent
     def code_generator(self) -> Agent:
         return Agent(
             config=self.agents_config["code_generator"],  # type: ignore[index]
             llm=self.llm_developer,
-            verbose=True,
+            verbose=settings.CREW_VERBOSE,
         )
 
     # Agents
@@ -48,7 +51,7 @@ class JuniorDevelopmentCrew:
         return Agent(
             config=self.agents_config["reviewer"],  # type: ignore[index]
             llm=self.llm_reviewer,
-            verbose=True,
+            verbose=settings.CREW_VERBOSE,
         )
 
     @agent
@@ -56,7 +59,7 @@ class JuniorDevelopmentCrew:
         return Agent(
             config=self.agents_config["debugger"],  # type: ignore[index]
             llm=self.llm_debugger,
-            verbose=True,
+            verbose=settings.CREW_VERBOSE,
         )
 
     @task
@@ -74,13 +77,13 @@ class JuniorDevelopmentCrew:
     def debug_if_needed(self) -> Task:
         return ConditionalTask(
             config=self.tasks_config["debug_if_needed"],
-            condition=is_something_to_fix,
+            condition=has_fixes,
             output_json=DebugIfNeededOutput,
         )
 
     @crew
     def crew(self) -> Crew:
-        return Crew(
+        return CachedCrew(
             agents=self.agents,
             tasks=[
                 self.generate_code(),
@@ -88,8 +91,8 @@ class JuniorDevelopmentCrew:
                 self.debug_if_needed(),
             ],
             process=Process.sequential,
-            output_log_file=True,
-            verbose=True,
+            output_log_file=settings.CREW_OUTPUT_LOG_FILE,
+            verbose=settings.CREW_VERBOSE,
         )
 
 
@@ -101,9 +104,9 @@ class SeniorDevelopmentCrew(JuniorDevelopmentCrew):
 
     def __init__(self):
         super().__init__()
-        self.llm_developer = llms()["medium"]
-        self.llm_reviewer = llms()["light"]
-        self.llm_debugger = llms()["light"]
+        self.llm_developer = self.llm_medium
+        self.llm_reviewer = self.llm_light
+        self.llm_debugger = self.llm_light
 
 
 class LeadDevelopmentCrew(JuniorDevelopmentCrew):
@@ -114,6 +117,6 @@ class LeadDevelopmentCrew(JuniorDevelopmentCrew):
 
     def __init__(self):
         super().__init__()
-        self.llm_developer = llms()["reasoning"]
-        self.llm_reviewer = llms()["medium"]
-        self.llm_debugger = llms()["medium"]
+        self.llm_developer = self.llm_reasoning
+        self.llm_reviewer = self.llm_medium
+        self.llm_debugger = self.llm_medium
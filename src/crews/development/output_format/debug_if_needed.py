@@ -1,6 +1,7 @@
 from __future__ import annotations
 from typing import List
-from pydantic import BaseModel, RootModel
+from pydantic import RootModel
+from ....utils.schemas import CachedSchemaMixin, FrozenModel
 
 
 DEBUG_IF_NEEDED_SCHEMA = '''
@@ -12,11 +13,11 @@ DEBUG_IF_NEEDED_SCHEMA = '''
 '''
 
 
-class DebugFix(BaseModel):
+class DebugFix(FrozenModel):
     file_path: str
     affected_callable: str
     fix: str
 
 
-class DebugIfNeededOutput(RootModel[List[DebugFix]]):
+class DebugIfNeededOutput(CachedSchemaMixin, RootModel[List[DebugFix]]):
     pass
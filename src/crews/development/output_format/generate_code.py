@@ -1,15 +1,16 @@
 from __future__ import annotations
 from typing import List
-from pydantic import BaseModel, RootModel
+from pydantic import RootModel
+from ....utils.schemas import CachedSchemaMixin, FrozenModel
 
 
 GENERATE_CODE_SCHEMA = '[{"path": str, "content": str}]'
 
 
-class CodeFile(BaseModel):
+class CodeFile(FrozenModel):
     path: str
     content: str
 
 
-class GenerateCodeOutput(RootModel[List[CodeFile]]):
+class GenerateCodeOutput(CachedSchemaMixin, RootModel[List[CodeFile]]):
     pass
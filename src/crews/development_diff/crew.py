@@ -1,18 +1,21 @@
 from __future__ import annotations
+from functools import partial
 from typing import List
-from crewai import Agent, Task, Crew, Process, TaskOutput
+from crewai import Agent, Task, Crew, Process
 from crewai.tasks.conditional_task import ConditionalTask
 from crewai.project import CrewBase, agent, crew, task
 from crewai.agents.agent_builder.base_agent import BaseAgent
-from ...utils.routing import llms
+from ... import settings
+from ...utils.routing import get_llm
+from ...utils.crew_config import cached_configs
+from ...flows.utils import is_something_to_fix
 from .output_format.generate_diffs import GenerateDiffsOutput
 
 
-def has_diffs(output: TaskOutput) -> bool:
-    output_str = str(output)
-    return len(output_str) > 2 and '{' in output_str and '}' in output_str and 'content_diff' in output_str
+has_diffs = partial(is_something_to_fix, required_token='content_diff')
 
 
+@cached_configs
 @CrewBase
 class JuniorDevelopmentDiffCrew:
     """
@@ -23,18 +26,18 @@ class JuniorDevelopmentDiffCrew:
     tasks: List[Task]
 
     def __init__(self):
-        self.llm_light = llms()["light"]
-        self.llm_medium = llms()["medium"]
-        self.llm_reasoning = llms()["reasoning"]
+        self.llm_light = get_llm("light")
+        self.llm_medium = get_llm("medium")
+        self.llm_reasoning = get_llm("reasoning")
 
-        self.llm_developer = llms()["light"]
+        self.llm_developer = get_llm("light")
 
     @agent
     def code_diff_generator(self) -> Agent:
         return Agent(
             config=self.agents_config["code_diff_generator"],
             llm=self.llm_developer,
-            verbose=True,
+            verbose=settings.CREW_VERBOSE,
         )
 
     @task
@@ -52,18 +55,18 @@ class JuniorDevelopmentDiffCrew:
                 self.generate_diffs(),
             ],
             process=Process.sequential,
-            output_log_file=True,
-            verbose=True,
+            output_log_file=settings.CREW_OUTPUT_LOG_FILE,
+            verbose=settings.CREW_VERBOSE,
         )
 
 
 class SeniorDevelopmentDiffCrew(JuniorDevelopmentDiffCrew):
     def __init__(self):
         super().__init__()
-        self.llm_developer = llms()["medium"]
+        self.llm_developer = self.llm_medium
 
 
 class LeadDevelopmentDiffCrew(JuniorDevelopmentDiffCrew):
     def __init__(self):
         super().__init__()
-        self.llm_developer = llms()["reasoning"]
+        self.llm_developer = self.llm_reasoning
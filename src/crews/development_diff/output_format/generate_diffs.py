@@ -1,6 +1,7 @@
 from __future__ import annotations
 from typing import List
-from pydantic import BaseModel, RootModel
+from pydantic import RootModel
+from ....utils.schemas import CachedSchemaMixin, FrozenModel
 
 
 GENERATE_DIFFS_SCHEMA = '''
@@ -10,10 +11,10 @@ GENERATE_DIFFS_SCHEMA = '''
 '''
 
 
-class DiffFile(BaseModel):
+class DiffFile(FrozenModel):
     path: str
     content_diff: str
 
 
-class GenerateDiffsOutput(RootModel[List[DiffFile]]):
+class GenerateDiffsOutput(CachedSchemaMixin, RootModel[List[DiffFile]]):
     pass
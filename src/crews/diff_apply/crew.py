@@ -4,10 +4,14 @@ from crewai import Agent, Task, Crew, Process
 from crewai.project import CrewBase, agent, crew, task
 from crewai.agents.agent_builder.base_agent import BaseAgent
 
-from ...utils.routing import llms
+from ... import settings
+from ...utils.routing import get_llm
+from ...utils.semantic_cache import CachedCrew
+from ...utils.crew_config import cached_configs
 from .output_format.full_file import FullFileOutput
 
 
+@cached_configs
 @CrewBase
 class DiffApplyCrew:
     """
@@ -18,14 +22,14 @@ class DiffApplyCrew:
     tasks: List[Task]
 
     def __init__(self) -> None:
-        self.llm_light = llms()["light"]
+        self.llm_light = get_llm("light")
 
     @agent
     def diff_apply_engineer(self) -> Agent:
         return Agent(
             config=self.agents_config["diff_apply_engineer"],  # type: ignore[index]
             llm=self.llm_light,
-            verbose=True,
+            verbose=settings.CREW_VERBOSE,
         )
 
     @task
@@ -37,10 +41,10 @@ class DiffApplyCrew:
 
     @crew
     def crew(self) -> Crew:
-        return Crew(
+        return CachedCrew(
             agents=[self.diff_apply_engineer()],
             tasks=[self.apply_unified_diff()],
             process=Process.sequential,
-            output_log_file=True,
-            verbose=True,
+            output_log_file=settings.CREW_OUTPUT_LOG_FILE,
+            verbose=settings.CREW_VERBOSE,
         )
@@ -1,5 +1,6 @@
 from __future__ import annotations
 from pydantic import RootModel
+from ....utils.schemas import CachedSchemaMixin
 
 
 FULL_FILE_SCHEMA = '''
@@ -7,5 +8,5 @@ str
 '''
 
 
-class FullFileOutput(RootModel[str]):
+class FullFileOutput(CachedSchemaMixin, RootModel[str]):
     pass
@@ -1,5 +1,6 @@
 from __future__ import annotations
 from pydantic import RootModel
+from ....utils.schemas import CachedSchemaMixin
 
 
 DOC_UNIFIED_DIFF_SCHEMA = '''
@@ -7,5 +8,5 @@ str
 '''
 
 
-class DocUnifiedDiffOutput(RootModel[str]):
+class DocUnifiedDiffOutput(CachedSchemaMixin, RootModel[str]):
     pass
@@ -4,10 +4,14 @@ from crewai import Agent, Task, Crew, Process
 from crewai.project import CrewBase, agent, crew, task
 from crewai.agents.agent_builder.base_agent import BaseAgent
 
-from ...utils.routing import llms
+from ... import settings
+from ...utils.routing import get_llm
+from ...utils.semantic_cache import CachedCrew
+from ...utils.crew_config import cached_configs
 from .output_format.relevant_docs import RelevantDocsOutput
 
 
+@cached_configs
 @CrewBase
 class DocsRelevanceCrew:
     """
@@ -20,14 +24,14 @@ class DocsRelevanceCrew:
     tasks: List[Task]
 
     def __init__(self) -> None:
-        self.llm_reasoning = llms()["reasoning"]
+        self.llm_reasoning = get_llm("reasoning")
 
     @agent
     def relevance_analyst(self) -> Agent:
         return Agent(
             config=self.agents_config["relevance_analyst"],  # type: ignore[index]
             llm=self.llm_reasoning,
-            verbose=True,
+            verbose=settings.CREW_VERBOSE,
         )
 
     @task
@@ -39,10 +43,12 @@ class DocsRelevanceCrew:
 
     @crew
     def crew(self) -> Crew:
-        return Crew(
+        # Similar queries select the same docs: near matches may be reused
+        return CachedCrew(
+            semantic=True,
             agents=[self.relevance_analyst()],
             tasks=[self.select_relevant_docs()],
             process=Process.sequential,
-            output_log_file=True,
-            verbose=True,
+            output_log_file=settings.CREW_OUTPUT_LOG_FILE,
+            verbose=settings.CREW_VERBOSE,
         )
@@ -1,6 +1,7 @@
 from __future__ import annotations
 from typing import List
 from pydantic import RootModel
+from ....utils.schemas import CachedSchemaMixin
 
 
 RELEVANT_DOCS_SCHEMA = '''
@@ -8,6 +9,6 @@ RELEVANT_DOCS_SCHEMA = '''
 '''
 
 
-class RelevantDocsOutput(RootModel[List[str]]):
+class RelevantDocsOutput(CachedSchemaMixin, RootModel[List[str]]):
     pass
 
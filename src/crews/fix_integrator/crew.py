@@ -3,9 +3,12 @@ from typing import List
 from crewai import Agent, Task, Crew, Process
 from crewai.project import CrewBase, agent, crew, task
 from crewai.agents.agent_builder.base_agent import BaseAgent
-from ...utils.routing import llms
+from ... import settings
+from ...utils.routing import get_llm
+from ...utils.crew_config import cached_configs
 
 
+@cached_configs
 @CrewBase
 class FixIntegratorCrew:
     """
@@ -18,14 +21,14 @@ class FixIntegratorCrew:
     tasks: List[Task]
 
     def __init__(self):
-        self.llm_light = llms()["light"]
+        self.llm_light = get_llm("light")
 
     @agent
     def fix_integrator(self) -> Agent:
         return Agent(
             config=self.agents_config["fix_integrator"],  # type: ignore[index]
             llm=self.llm_light,
-            verbose=True,
+            verbose=settings.CREW_VERBOSE,
         )
 
     @task
@@ -38,6 +41,6 @@ class FixIntegratorCrew:
             agents=[self.fix_integrator()],
             tasks=[self.integrate_fixes()],
             process=Process.sequential,
-            output_log_file=True,
-            verbose=True,
+            output_log_file=settings.CREW_OUTPUT_LOG_FILE,
+            verbose=settings.CREW_VERBOSE,
         )
@@ -3,9 +3,13 @@ from typing import List
 from crewai import Agent, Task, Crew, Process
 from crewai.project import CrewBase, agent, crew, task
 from crewai.agents.agent_builder.base_agent import BaseAgent
-from ...utils.routing import llms
+from ... import settings
+from ...utils.routing import get_llm
+from ...utils.semantic_cache import CachedCrew
+from ...utils.crew_config import cached_configs
 
 
+@cached_configs
 @CrewBase
 class JSONFixerCrew:
     """
@@ -17,15 +21,14 @@ class JSONFixerCrew:
     tasks: List[Task]
 
     def __init__(self):
-        self.llm_light = llms()["light"]
-        self.llm_reasoning = llms()["reasoning"]
+        self.llm_light = get_llm("light")
 
     @agent
     def json_doctor(self) -> Agent:
         return Agent(
             config=self.agents_config["json_doctor"],  # type: ignore[index]
             llm=self.llm_light,
-            verbose=True,
+            verbose=settings.CREW_VERBOSE,
         )
 
     @task
@@ -34,10 +37,10 @@ class JSONFixerCrew:
 
     @crew
     def crew(self) -> Crew:
-        return Crew(
+        return CachedCrew(
             agents=[self.json_doctor()],
             tasks=[self.fix_json()],
             process=Process.sequential,
-            output_log_file=True,
-            verbose=True,
+            output_log_file=settings.CREW_OUTPUT_LOG_FILE,
+            verbose=settings.CREW_VERBOSE,
         )
@@ -1,10 +1,11 @@
 from __future__ import annotations
 from typing import Dict
 from pydantic import RootModel
+from ....utils.schemas import CachedSchemaMixin
 
 
 MOVE_MAP_SCHEMA = '{"old_path": "new_path"}'
 
 
-class MoveMapOutput(RootModel[Dict[str, str]]):
+class MoveMapOutput(CachedSchemaMixin, RootModel[Dict[str, str]]):
     pass
@@ -4,12 +4,15 @@ from crewai import Agent, Task, Crew, Process
 from crewai.project import CrewBase, agent, crew, task
 from crewai.agents.agent_builder.base_agent import BaseAgent
 
-from ...utils.routing import llms
+from ... import settings
+from ...utils.routing import get_llm
+from ...utils.crew_config import cached_configs
 from .output_format.relevant_files import RelevantFilesOutput
 from .output_format.file_detail import FileDetailOutput
 from .output_format.action_plan import ActionPlanOutput
 
 
+@cached_configs
 @CrewBase
 class BaseCrew:
     """
@@ -21,16 +24,14 @@ class BaseCrew:
     tasks: List[Task]
 
     def __init__(self):
-        self.llm_light = llms()["light"]
-        self.llm_medium = llms()["medium"]
-        self.llm_reasoning = llms()["reasoning"]
+        self.llm_reasoning = get_llm("reasoning")
 
     @agent
     def analyst(self) -> Agent:
         return Agent(
             config=self.agents_config["analyst"],
             llm=self.llm_reasoning,
-            verbose=True,
+            verbose=settings.CREW_VERBOSE,
         )
 
     @agent
@@ -38,7 +39,7 @@ class BaseCrew:
         return Agent(
             config=self.agents_config["classifier"],  # type: ignore[index]
             llm=self.llm_reasoning,
-            verbose=True,
+            verbose=settings.CREW_VERBOSE,
         )
 
     @agent
@@ -46,7 +47,7 @@ class BaseCrew:
         return Agent(
             config=self.agents_config["planner"],  # type: ignore[index]
             llm=self.llm_reasoning,
-            verbose=True,
+            verbose=settings.CREW_VERBOSE,
         )
 
 
@@ -69,8 +70,8 @@ class RelevanceCrew(BaseCrew):
             agents=[self.analyst()],
             tasks=[self.select_relevant_files()],
             process=Process.sequential,
-            output_log_file=True,
-            verbose=True,
+            output_log_file=settings.CREW_OUTPUT_LOG_FILE,
+            verbose=settings.CREW_VERBOSE,
         )
 
 
@@ -93,8 +94,8 @@ class FileDetailCrew(BaseCrew):
             agents=[self.classifier()],
             tasks=[self.classify_file_detail()],
             process=Process.sequential,
-            output_log_file=True,
-            verbose=True,
+            output_log_file=settings.CREW_OUTPUT_LOG_FILE,
+            verbose=settings.CREW_VERBOSE,
         )
 
 
@@ -117,6 +118,6 @@ class ActionPlanCrew(BaseCrew):
             agents=[self.planner()],
             tasks=[self.produce_action_plan()],
             process=Process.sequential,
-            output_log_file=True,
-            verbose=True,
+            output_log_file=settings.CREW_OUTPUT_LOG_FILE,
+            verbose=settings.CREW_VERBOSE,
         )
@@ -1,6 +1,7 @@
 from __future__ import annotations
 from typing import List
-from pydantic import BaseModel, Field, RootModel
+from pydantic import Field, RootModel
+from ....utils.schemas import CachedSchemaMixin, FrozenModel
 
 
 ACTION_PLAN_SCHEMA = '''
@@ -17,7 +18,7 @@ ACTION_PLAN_SCHEMA = '''
 '''
 
 
-class ActionStep(BaseModel):
+class ActionStep(FrozenModel):
     step: int
     title: str
     description: str
@@ -25,5 +26,5 @@ class ActionStep(BaseModel):
     type: str
     points: int = Field(default=1)
 
-class ActionPlanOutput(RootModel[List[ActionStep]]):
+class ActionPlanOutput(CachedSchemaMixin, RootModel[List[ActionStep]]):
     pass
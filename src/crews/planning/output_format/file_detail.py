@@ -1,6 +1,7 @@
 from __future__ import annotations
 from typing import List
-from pydantic import BaseModel, Field
+from pydantic import Field
+from ....utils.schemas import CachedSchemaMixin, FrozenModel
 
 
 FILE_DETAIL_SCHEMA = '''
@@ -11,6 +12,6 @@ FILE_DETAIL_SCHEMA = '''
 '''
 
 
-class FileDetailOutput(BaseModel):
+class FileDetailOutput(CachedSchemaMixin, FrozenModel):
     summaries_only: List[str] = Field(default_factory=list)
     need_code: List[str] = Field(default_factory=list)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 from typing import List
 from pydantic import RootModel
+from ....utils.schemas import CachedSchemaMixin
 
 
 RELEVANT_FILES_SCHEMA = '''
@@ -8,5 +9,5 @@ RELEVANT_FILES_SCHEMA = '''
 '''
 
 
-class RelevantFilesOutput(RootModel[List[str]]):
+class RelevantFilesOutput(CachedSchemaMixin, RootModel[List[str]]):
     pass
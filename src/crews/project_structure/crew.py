@@ -3,10 +3,13 @@ from typing import List
 from crewai import Agent, Task, Crew, Process
 from crewai.project import CrewBase, agent, crew, task
 from crewai.agents.agent_builder.base_agent import BaseAgent
-from ...utils.routing import llms
+from ... import settings
+from ...utils.routing import get_llm
+from ...utils.crew_config import cached_configs
 from .output_format.project_structure import ProjectStructureOutput
 
 
+@cached_configs
 @CrewBase
 class ProjectStructureCrew:
     """
@@ -17,14 +20,14 @@ class ProjectStructureCrew:
     tasks: List[Task]
 
     def __init__(self):
-        self.llm_light = llms()["light"]
+        self.llm_light = get_llm("light")
 
     @agent
     def structure_analyst(self) -> Agent:
         return Agent(
             config=self.agents_config["structure_analyst"],
             llm=self.llm_light,
-            verbose=True,
+            verbose=settings.CREW_VERBOSE,
         )
 
     @task
@@ -40,6 +43,6 @@ class ProjectStructureCrew:
             agents=[self.structure_analyst()],
             tasks=[self.analyze_project_structure()],
             process=Process.sequential,
-            output_log_file=True,
-            verbose=True,
+            output_log_file=settings.CREW_OUTPUT_LOG_FILE,
+            verbose=settings.CREW_VERBOSE,
         )
@@ -1,6 +1,6 @@
 from __future__ import annotations
 from typing import List, Optional
-from pydantic import BaseModel
+from ....utils.schemas import CachedSchemaMixin, FrozenModel
 
 
 PROJECT_STRUCTURE_SCHEMA = '''
@@ -12,7 +12,7 @@ PROJECT_STRUCTURE_SCHEMA = '''
 '''
 
 
-class ProjectStructureOutput(BaseModel):
+class ProjectStructureOutput(CachedSchemaMixin, FrozenModel):
     code_dir: str
     docs_dir: Optional[str]
     test_dirs: List[str]
@@ -5,10 +5,13 @@ from crewai import Agent, Task, Crew, Process
 from crewai.project import CrewBase, agent, crew, task
 from crewai.agents.agent_builder.base_agent import BaseAgent
 
-from ...utils.routing import llms
+from ... import settings
+from ...utils.routing import get_llm
+from ...utils.crew_config import cached_configs
 from ..docs_diff.output_format.doc_unified_diff import DocUnifiedDiffOutput
 
 
+@cached_configs
 @CrewBase
 class ReleaseNotesUpdateCrew:
     """
@@ -20,14 +23,14 @@ class ReleaseNotesUpdateCrew:
     tasks: List[Task]
 
     def __init__(self) -> None:
-        self.llm_light = llms()["light"]
+        self.llm_light = get_llm("light")
 
     @agent
     def release_notes_editor(self) -> Agent:
         return Agent(
             config=self.agents_config["release_notes_editor"],  # type: ignore[index]
             llm=self.llm_light,
-            verbose=True,
+            verbose=settings.CREW_VERBOSE,
         )
 
     @task
@@ -43,6 +46,6 @@ class ReleaseNotesUpdateCrew:
             agents=[self.release_notes_editor()],
             tasks=[self.update_release_notes()],
             process=Process.sequential,
-            output_log_file=True,
-            verbose=True,
+            output_log_file=settings.CREW_OUTPUT_LOG_FILE,
+            verbose=settings.CREW_VERBOSE,
         )
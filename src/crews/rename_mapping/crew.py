@@ -5,24 +5,27 @@ from crewai import Agent, Task, Crew, Process
 from crewai.project import CrewBase, agent, crew, task
 from crewai.agents.agent_builder.base_agent import BaseAgent
 
-from ...utils.routing import llms
+from ... import settings
+from ...utils.routing import get_llm
+from ...utils.crew_config import cached_configs
 from .output_format.rename_map import RenameMapOutput
 
 
+@cached_configs
 @CrewBase
 class RenameMappingCrew:
     agents: List[BaseAgent]
     tasks: List[Task]
 
     def __init__(self) -> None:
-        self.llm_light = llms()["light"]
+        self.llm_light = get_llm("light")
 
     @agent
     def mapper(self) -> Agent:
         return Agent(
             config=self.agents_config["mapper"],
             llm=self.llm_light,
-            verbose=True,
+            verbose=settings.CREW_VERBOSE,
         )
 
     @task
@@ -38,6 +41,6 @@ class RenameMappingCrew:
             agents=[self.mapper()],
             tasks=[self.produce_rename_map()],
             process=Process.sequential,
-            output_log_file=True,
-            verbose=True,
+            output_log_file=settings.CREW_OUTPUT_LOG_FILE,
+            verbose=settings.CREW_VERBOSE,
         )
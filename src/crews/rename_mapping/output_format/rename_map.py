@@ -1,10 +1,11 @@
 from __future__ import annotations
 from typing import Dict
 from pydantic import RootModel
+from ....utils.schemas import CachedSchemaMixin
 
 
 RENAME_MAP_SCHEMA = '{"old_path": "new_path"}'
 
 
-class RenameMapOutput(RootModel[Dict[str, str]]):
+class RenameMapOutput(CachedSchemaMixin, RootModel[Dict[str, str]]):
     pass
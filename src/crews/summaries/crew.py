@@ -3,9 +3,12 @@ from typing import List
 from crewai import Agent, Task
 from crewai.project import CrewBase, agent
 from crewai.agents.agent_builder.base_agent import BaseAgent
-from ...utils.routing import llms
+from ... import settings
+from ...utils.routing import get_llm
+from ...utils.crew_config import cached_configs
 
 
+@cached_configs
 @CrewBase
 class BaseSummariesCrew:
     """
@@ -17,16 +20,14 @@ class BaseSummariesCrew:
     tasks: List[Task]
 
     def __init__(self):
-        self.llm_light = llms()["light"]
-        self.llm_medium = llms()["medium"]
-        self.llm_reasoning = llms()["reasoning"]
+        self.llm_light = get_llm("light")
 
     @agent
     def summarizer(self) -> Agent:
         return Agent(
             config=self.agents_config["summarizer"],
             llm=self.llm_light,
-            verbose=True,
+            verbose=settings.CREW_VERBOSE,
         )
 
     @agent
@@ -34,5 +35,5 @@ class BaseSummariesCrew:
         return Agent(
             config=self.agents_config["module_summarizer"],
             llm=self.llm_light,
-            verbose=True,
+            verbose=settings.CREW_VERBOSE,
         )
@@ -1,14 +1,16 @@
 from __future__ import annotations
 from crewai import Crew, Process, Task
 from crewai.project import crew, task
+from ... import settings
 from .crew import BaseSummariesCrew
-from .output_format.summaries import FileSummariesOutput
+from .output_format.summaries import FileSummariesBatchOutput
 
 
 class FileSummariesCrew(BaseSummariesCrew):
     """
     Specialized crew that only generates per-file summaries.
     Uses the same agents and task definitions but executes only the file task.
+    One kickoff summarizes a whole batch of ``{path, content}`` files.
     """
 
     original_tasks_config_path = "config/file_summaries_task.yaml"
@@ -17,7 +19,7 @@ class FileSummariesCrew(BaseSummariesCrew):
     def summarize_chunk(self) -> Task:
         return Task(
             config=self.tasks_config["summarize_chunk"],
-            output_json=FileSummariesOutput,
+            output_json=FileSummariesBatchOutput,
         )
 
     @crew
@@ -26,6 +28,6 @@ class FileSummariesCrew(BaseSummariesCrew):
             agents=[self.summarizer()],
             tasks=[self.summarize_chunk()],
             process=Process.sequential,
-            output_log_file=True,
-            verbose=True,
+            output_log_file=settings.CREW_OUTPUT_LOG_FILE,
+            verbose=settings.CREW_VERBOSE,
         )
@@ -1,6 +1,7 @@
 from __future__ import annotations
 from crewai import Crew, Process, Task
 from crewai.project import crew, task
+from ... import settings
 from .crew import BaseSummariesCrew
 from .output_format.summaries import ModuleSummariesOutput
 
@@ -26,6 +27,6 @@ class ModuleSummariesCrew(BaseSummariesCrew):
             agents=[self.module_summarizer()],
             tasks=[self.summarize_modules()],
             process=Process.sequential,
-            output_log_file=True,
-            verbose=True,
+            output_log_file=settings.CREW_OUTPUT_LOG_FILE,
+            verbose=settings.CREW_VERBOSE,
         )
@@ -1,6 +1,8 @@
 from __future__ import annotations
 from typing import List, Optional
-from pydantic import BaseModel
+from pydantic import RootModel
+from typing_extensions import NotRequired, TypedDict
+from ....utils.schemas import CachedSchemaMixin, FrozenModel
 
 
 # ---------------------------
@@ -43,32 +45,35 @@ FILE_SUMMARIES_SCHEMA = '''
 '''
 
 
-class FileInternalDependency(BaseModel):
+# Leaf records are validated into plain dicts (no model class per record);
+# they dump to the same JSON as before. Dependencies are shared by file and
+# module summaries.
+class InternalDependency(TypedDict):
     path: str
-    reason: Optional[str] = None
+    reason: NotRequired[Optional[str]]
 
 
-class FileExternalDependency(BaseModel):
+class ExternalDependency(TypedDict):
     name: str
-    purpose: Optional[str] = None
+    purpose: NotRequired[Optional[str]]
 
 
-class FileMethodParameter(BaseModel):
+class FileMethodParameter(TypedDict):
     name: str
-    type: Optional[str] = None
+    type: NotRequired[Optional[str]]
 
 
-class FileMethodReturn(BaseModel):
-    type: Optional[str] = None
-    description: Optional[str] = None
+class FileMethodReturn(TypedDict, total=False):
+    type: Optional[str]
+    description: Optional[str]
 
 
-class FileMethodRaise(BaseModel):
+class FileMethodRaise(TypedDict):
     exception: str
-    description: Optional[str] = None
+    description: NotRequired[Optional[str]]
 
 
-class FileMethod(BaseModel):
+class FileMethod(FrozenModel):
     name: str
     signature: Optional[str] = None
     description: Optional[str] = None
@@ -77,19 +82,19 @@ class FileMethod(BaseModel):
     raises: List[FileMethodRaise] = []
 
 
-class FileAttribute(BaseModel):
+class FileAttribute(TypedDict):
     name: str
-    type: Optional[str] = None
+    type: NotRequired[Optional[str]]
 
 
-class FileClass(BaseModel):
+class FileClass(FrozenModel):
     name: str
     responsibility: Optional[str] = None
     attributes: List[FileAttribute] = []
     methods: List[FileMethod] = []
 
 
-class FileFunction(BaseModel):
+class FileFunction(FrozenModel):
     name: str
     signature: Optional[str] = None
     purpose: Optional[str] = None
@@ -98,36 +103,54 @@ class FileFunction(BaseModel):
     raises: List[FileMethodRaise] = []
 
 
-class FileGlobal(BaseModel):
+class FileGlobal(TypedDict):
     name: str
-    value: Optional[str] = None
-    purpose: Optional[str] = None
+    value: NotRequired[Optional[str]]
+    purpose: NotRequired[Optional[str]]
 
 
-class FileStructure(BaseModel):
+class FileStructure(FrozenModel):
     classes: List[FileClass] = []
     functions: List[FileFunction] = []
     globals: List[FileGlobal] = []
 
 
-class FileDependencies(BaseModel):
-    internal: List[FileInternalDependency] = []
-    external: List[FileExternalDependency] = []
+# Same shape in file summaries and in module relationships
+class Dependencies(FrozenModel):
+    internal: List[InternalDependency] = []
+    external: List[ExternalDependency] = []
 
 
-class FileExample(BaseModel):
-    language: Optional[str] = None
-    code: Optional[str] = None
+class FileExample(TypedDict, total=False):
+    language: Optional[str]
+    code: Optional[str]
 
 
-class FileSummariesOutput(BaseModel):
+class FileSummariesOutput(FrozenModel):
     location: Optional[str] = None
     purpose: Optional[str] = None
-    dependencies: Optional[FileDependencies] = None
+    dependencies: Optional[Dependencies] = None
     structure: Optional[FileStructure] = None
     examples: List[FileExample] = []
 
 
+# One summary per input file, so several files share a single kickoff
+FILE_SUMMARIES_BATCH_SCHEMA = (
+    '[{\n  "path": str,\n  "summary":'
+    + FILE_SUMMARIES_SCHEMA.rstrip().replace("\n", "\n  ")
+    + "\n}]\n"
+)
+
+
+class FileSummaryEntry(FrozenModel):
+    path: str
+    summary: FileSummariesOutput
+
+
+class FileSummariesBatchOutput(CachedSchemaMixin, RootModel[List[FileSummaryEntry]]):
+    pass
+
+
 # ---------------------------
 # Module summaries schema and models
 # ---------------------------
@@ -156,53 +179,33 @@ MODULE_SUMMARIES_SCHEMA = '''
 '''
 
 
-class ModuleInternalDependency(BaseModel):
-    path: str
-    reason: Optional[str] = None
-
-
-class ModuleExternalDependency(BaseModel):
-    name: str
-    purpose: Optional[str] = None
-
-
-class Dependencies(BaseModel):
-    internal: List[ModuleInternalDependency] = []
-    external: List[ModuleExternalDependency] = []
-
-
-class ModuleRelationships(BaseModel):
+class ModuleRelationships(FrozenModel):
     dependencies: Dependencies = Dependencies()
 
 
-class ModuleMethod(BaseModel):
+# Methods and functions of a module interface have the same shape
+class ModuleCallable(TypedDict):
     name: str
-    signature: Optional[str] = None
-    description: Optional[str] = None
-
-
-class ModuleClass(BaseModel):
-    name: str
-    description: Optional[str] = None
-    methods: List[ModuleMethod] = []
+    signature: NotRequired[Optional[str]]
+    description: NotRequired[Optional[str]]
 
 
-class ModuleFunction(BaseModel):
+class ModuleClass(FrozenModel):
     name: str
-    signature: Optional[str] = None
     description: Optional[str] = None
+    methods: List[ModuleCallable] = []
 
 
-class ModuleInterfaces(BaseModel):
+class ModuleInterfaces(FrozenModel):
     classes: List[ModuleClass] = []
-    functions: List[ModuleFunction] = []
+    functions: List[ModuleCallable] = []
 
 
-class ModuleStructure(BaseModel):
+class ModuleStructure(FrozenModel):
     tree: List[str] = []
 
 
-class ModuleSummariesOutput(BaseModel):
+class ModuleSummariesOutput(CachedSchemaMixin, FrozenModel):
     location: Optional[str] = None
     purpose: Optional[str] = None
     structure: Optional[ModuleStructure] = None
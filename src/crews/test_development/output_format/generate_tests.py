@@ -1,6 +1,8 @@
 from __future__ import annotations
 from typing import List
-from pydantic import BaseModel, RootModel
+from pydantic import RootModel
+from typing_extensions import TypedDict
+from ....utils.schemas import CachedSchemaMixin
 
 
 GENERATE_TESTS_SCHEMA = '''
@@ -11,10 +13,10 @@ GENERATE_TESTS_SCHEMA = '''
 '''
 
 
-class TestFile(BaseModel):
+class TestFile(TypedDict):
     path: str
     content: str
 
 
-class GenerateTestsOutput(RootModel[List[TestFile]]):
+class GenerateTestsOutput(CachedSchemaMixin, RootModel[List[TestFile]]):
     pass
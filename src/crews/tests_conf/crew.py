@@ -3,10 +3,13 @@ from typing import List
 from crewai import Agent, Task, Crew, Process
 from crewai.project import CrewBase, agent, crew, task
 from crewai.agents.agent_builder.base_agent import BaseAgent
-from ...utils.routing import llms
+from ... import settings
+from ...utils.routing import get_llm
+from ...utils.crew_config import cached_configs
 from .output_format.tests_conf import TestsConfOutput
 
 
+@cached_configs
 @CrewBase
 class TestsConfCrew:
     """
@@ -19,14 +22,14 @@ class TestsConfCrew:
     tasks: List[Task]
 
     def __init__(self):
-        self.llm_reasoning = llms()["reasoning"]
+        self.llm_reasoning = get_llm("reasoning")
 
     @agent
     def test_analyst(self) -> Agent:
         return Agent(
             config=self.agents_config["test_analyst"],
             llm=self.llm_reasoning,
-            verbose=True,
+            verbose=settings.CREW_VERBOSE,
         )
 
     @task
@@ -42,6 +45,6 @@ class TestsConfCrew:
             agents=[self.test_analyst()],
             tasks=[self.determine_tests_conf()],
             process=Process.sequential,
-            output_log_file=True,
-            verbose=True,
+            output_log_file=settings.CREW_OUTPUT_LOG_FILE,
+            verbose=settings.CREW_VERBOSE,
         )
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from pydantic import BaseModel
+from ....utils.schemas import CachedSchemaMixin, FrozenModel
 
 
 TESTS_CONF_SCHEMA = '''
@@ -12,14 +12,7 @@ TESTS_CONF_SCHEMA = '''
 '''
 
 
-class TestsConf(BaseModel):
-    framework: str
-    command: str
-    description: str
-    examples: list[str] = []
-
-
-class TestsConfOutput(BaseModel):
+class TestsConfOutput(CachedSchemaMixin, FrozenModel):
     framework: str
     command: str
     description: str
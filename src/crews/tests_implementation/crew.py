@@ -3,10 +3,13 @@ from typing import List
 from crewai import Agent, Task, Crew, Process
 from crewai.project import CrewBase, agent, crew, task
 from crewai.agents.agent_builder.base_agent import BaseAgent
-from ...utils.routing import llms
+from ... import settings
+from ...utils.routing import get_llm
+from ...utils.crew_config import cached_configs
 from .output_format.implement_tests import ImplementTestsOutput
 
 
+@cached_configs
 @CrewBase
 class JuniorTestsImplementationCrew:
     """
@@ -18,11 +21,7 @@ class JuniorTestsImplementationCrew:
     tasks: List[Task]
 
     def __init__(self):
-        self.llm_light = llms()["light"]
-        self.llm_medium = llms()["medium"]
-        self.llm_reasoning = llms()["reasoning"]
-
-        self.llm_test_implementer = llms()["light"]
+        self.llm_test_implementer = get_llm("light")
 
     # Agents
     @agent
@@ -30,7 +29,7 @@ class JuniorTestsImplementationCrew:
         return Agent(
             config=self.agents_config["test_implementer"],  # type: ignore[index]
             llm=self.llm_test_implementer,
-            verbose=True,
+            verbose=settings.CREW_VERBOSE,
         )
 
     # Tasks
@@ -49,18 +48,18 @@ class JuniorTestsImplementationCrew:
                 self.implement_tests(),
             ],
             process=Process.sequential,
-            output_log_file=True,
-            verbose=True,
+            output_log_file=settings.CREW_OUTPUT_LOG_FILE,
+            verbose=settings.CREW_VERBOSE,
         )
 
 
 class SeniorTestsImplementationCrew(JuniorTestsImplementationCrew):
     def __init__(self):
         super().__init__()
-        self.llm_test_implementer = llms()["medium"]
+        self.llm_test_implementer = get_llm("medium")
 
 
 class LeadTestsImplementationCrew(JuniorTestsImplementationCrew):
     def __init__(self):
         super().__init__()
-        self.llm_test_implementer = llms()["reasoning"]
+        self.llm_test_implementer = get_llm("reasoning")
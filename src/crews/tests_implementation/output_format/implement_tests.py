@@ -1,6 +1,6 @@
 from __future__ import annotations
-from typing import List
-from pydantic import BaseModel, RootModel
+from pydantic import RootModel
+from ....utils.schemas import CachedSchemaMixin
 
 
 IMPLEMENT_TESTS_SCHEMA = '''
@@ -8,5 +8,5 @@ str
 '''
 
 
-class ImplementTestsOutput(RootModel[str]):
+class ImplementTestsOutput(CachedSchemaMixin, RootModel[str]):
     pass
@@ -3,10 +3,13 @@ from typing import List
 from crewai import Agent, Task, Crew, Process
 from crewai.project import CrewBase, agent, crew, task
 from crewai.agents.agent_builder.base_agent import BaseAgent
-from ...utils.routing import llms
+from ... import settings
+from ...utils.routing import get_llm
+from ...utils.crew_config import cached_configs
 from .output_format.test_plan import GenerateTestPlanOutput
 
 
+@cached_configs
 @CrewBase
 class JuniorTestsPlanningCrew:
     """
@@ -18,11 +21,7 @@ class JuniorTestsPlanningCrew:
     tasks: List[Task]
 
     def __init__(self):
-        self.llm_light = llms()["light"]
-        self.llm_medium = llms()["medium"]
-        self.llm_reasoning = llms()["reasoning"]
-
-        self.llm_planner = llms()["light"]
+        self.llm_planner = get_llm("light")
 
     # Agents
     @agent
@@ -30,7 +29,7 @@ class JuniorTestsPlanningCrew:
         return Agent(
             config=self.agents_config["test_planner"],  # type: ignore[index]
             llm=self.llm_planner,
-            verbose=True,
+            verbose=settings.CREW_VERBOSE,
         )
 
     # Tasks
@@ -49,18 +48,18 @@ class JuniorTestsPlanningCrew:
                 self.plan_tests(),
             ],
             process=Process.sequential,
-            output_log_file=True,
-            verbose=True,
+            output_log_file=settings.CREW_OUTPUT_LOG_FILE,
+            verbose=settings.CREW_VERBOSE,
         )
 
 
 class SeniorTestsPlanningCrew(JuniorTestsPlanningCrew):
     def __init__(self):
         super().__init__()
-        self.llm_planner = llms()["medium"]
+        self.llm_planner = get_llm("medium")
 
 
 class LeadTestsPlanningCrew(JuniorTestsPlanningCrew):
     def __init__(self):
         super().__init__()
-        self.llm_planner = llms()["reasoning"]
+        self.llm_planner = get_llm("reasoning")
@@ -1,6 +1,8 @@
 from __future__ import annotations
 from typing import List, Literal
-from pydantic import BaseModel, RootModel
+from pydantic import RootModel
+from typing_extensions import TypedDict
+from ....utils.schemas import CachedSchemaMixin
 
 
 TEST_PLAN_SCHEMA = '''
@@ -17,7 +19,7 @@ TEST_PLAN_SCHEMA = '''
 '''
 
 
-class TestPlanItem(BaseModel):
+class TestPlanItem(TypedDict):
     title: str
     description: str
     targets: List[str]
@@ -26,5 +28,5 @@ class TestPlanItem(BaseModel):
     test_type: Literal["unit", "integration"]
 
 
-class GenerateTestPlanOutput(RootModel[List[TestPlanItem]]):
+class GenerateTestPlanOutput(CachedSchemaMixin, RootModel[List[TestPlanItem]]):
     pass
@@ -3,10 +3,13 @@ from typing import List
 from crewai import Agent, Task, Crew, Process
 from crewai.project import CrewBase, agent, crew, task
 from crewai.agents.agent_builder.base_agent import BaseAgent
-from ...utils.routing import llms
+from ... import settings
+from ...utils.routing import get_llm
+from ...utils.crew_config import cached_configs
 from .output_format.relevant_tests import RelevantTestsOutput
 
 
+@cached_configs
 @CrewBase
 class TestsRelevanceCrew:
     """
@@ -19,14 +22,14 @@ class TestsRelevanceCrew:
     tasks: List[Task]
 
     def __init__(self) -> None:
-        self.llm_light = llms()["light"]
+        self.llm_light = get_llm("light")
 
     @agent
     def relevance_analyst(self) -> Agent:
         return Agent(
             config=self.agents_config["relevance_analyst"],  # type: ignore[index]
             llm=self.llm_light,
-            verbose=True,
+            verbose=settings.CREW_VERBOSE,
         )
 
     @task
@@ -42,6 +45,6 @@ class TestsRelevanceCrew:
             agents=[self.relevance_analyst()],
             tasks=[self.select_relevant_tests()],
             process=Process.sequential,
-            output_log_file=True,
-            verbose=True,
+            output_log_file=settings.CREW_OUTPUT_LOG_FILE,
+            verbose=settings.CREW_VERBOSE,
         )
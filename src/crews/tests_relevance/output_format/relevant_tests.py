@@ -1,5 +1,6 @@
 from __future__ import annotations
 from pydantic import RootModel
+from ....utils.schemas import CachedSchemaMixin
 
 
 RELEVANT_TESTS_SCHEMA = '''
@@ -7,5 +8,5 @@ str
 '''
 
 
-class RelevantTestsOutput(RootModel[str]):
+class RelevantTestsOutput(CachedSchemaMixin, RootModel[str]):
     pass
@@ -1,24 +1,214 @@
 from __future__ import annotations
-from typing import Dict, Any
+from pathlib import Path
+from typing import Dict, Any, Iterable, Iterator, List, Mapping, Tuple
+import threading
 
-from ..crews.summaries.file_summaries_crew import FileSummariesCrew
-from ..crews.summaries.module_summaries_crew import ModuleSummariesCrew
-from ..crews.summaries.output_format.summaries import MODULE_SUMMARIES_SCHEMA, FILE_SUMMARIES_SCHEMA
+import orjson
+from crewai import Crew
 
-from .utils import load_json_output
+from .. import settings
 
+from ..utils.routing import MAX_OUTPUT_TOKENS
+from ..utils.summaries_cache import load_summary, store_summary, summary_key
+from .utils import load_json_output, load_json_list, map_concurrently
 
-def generate_file_summaries_from_chunk(item: str) -> Dict[str, Dict[str, Any]]:
+
+_crews: Dict[str, Crew] = {}
+_crews_lock = threading.Lock()
+
+
+def _summaries_crew(factory: type) -> Crew:
+    """
+    Crew of ``factory`` for one kickoff. The crew is built once per process;
+    kickoff leaves state on its tasks and agents, so each kickoff gets its own
+    copy, as CrewAI's ``kickoff_for_each`` does.
     """
-    Generate per-file summaries for a given chunk of code items.
+    with _crews_lock:
+        crew = _crews.get(factory.__name__)
+        if crew is None:
+            crew = _crews[factory.__name__] = factory().crew()
+    return crew.copy()
+
+
+# Batches kept open for first-fit packing; bounds the files held before dispatch
+_OPEN_BATCHES = 4
+
+# Summaries output a batch may need, in characters: the light model's output
+# cap at ~4 characters per token, with a quarter kept as margin
+_OUTPUT_BUDGET = MAX_OUTPUT_TOKENS * 4 * 3 // 4
+
 
-    Returns a JSON object.
+def _expected_summary_chars(file: Mapping[str, str]) -> int:
+    """Rough size of a file's JSON summary: fixed fields plus what grows with the code."""
+    return 1500 + len(file["content"]) // 8
+
+
+def _pack_files(
+    files: Iterable[Dict[str, str]], budget: int, max_files: int, output_budget: int = _OUTPUT_BUDGET
+) -> Iterator[List[Dict[str, str]]]:
     """
+    First-fit pack files into batches of at most ``budget`` characters of input,
+    ``output_budget`` characters of expected summaries and ``max_files`` files:
+    each file goes into the first open batch it fits in, so small files fill the
+    gaps left by large ones. A batch is yielded once it is full; when more than
+    ``_OPEN_BATCHES`` are open, the fullest is yielded. A file larger than the
+    budgets gets a batch of its own.
+    """
+    batches: List[List[Any]] = []  # [size, expected output, files]
+    for file in files:
+        file_size = len(file["path"]) + len(file["content"])
+        file_output = _expected_summary_chars(file)
+        for batch in batches:
+            if (
+                batch[0] + file_size <= budget
+                and batch[1] + file_output <= output_budget
+                and len(batch[2]) < max_files
+            ):
+                batch[0] += file_size
+                batch[1] += file_output
+                batch[2].append(file)
+                break
+        else:
+            batch = [file_size, file_output, [file]]
+            batches.append(batch)
+        if batch[0] >= budget or batch[1] >= output_budget or len(batch[2]) >= max_files:
+            batches.remove(batch)
+            yield batch[2]
+        elif len(batches) > _OPEN_BATCHES:
+            fullest = max(batches, key=lambda b: b[0])
+            batches.remove(fullest)
+            yield fullest[2]
+    for batch in batches:
+        yield batch[2]
 
-    result = FileSummariesCrew().crew().kickoff(inputs={
-        "code_chunk": item,
-    })
-    return load_json_output(result, FILE_SUMMARIES_SCHEMA)
+
+def _split_lines(content: str, budget: int) -> List[Tuple[int, int, str]]:
+    """
+    Split ``content`` at line boundaries into parts of at most ``budget``
+    characters (a single longer line is a part of its own).
+    Returns ``(first_line, last_line, text)`` per part, 1-based.
+    """
+    parts: List[Tuple[int, int, str]] = []
+    current: List[str] = []
+    size = 0
+    first = 1
+    for number, line in enumerate(content.splitlines(keepends=True), start=1):
+        if current and size + len(line) > budget:
+            parts.append((first, number - 1, "".join(current)))
+            current, size, first = [], 0, number
+        current.append(line)
+        size += len(line)
+    if current:
+        parts.append((first, first + len(current) - 1, "".join(current)))
+    return parts
+
+
+def _merge_summaries(parts: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Merge the summaries of consecutive parts of one file: lists are
+    concatenated without duplicates, objects merged recursively, and other
+    values keep the first non-empty one.
+    """
+    merged: Dict[str, Any] = {}
+    for part in parts:
+        for key, value in part.items():
+            current = merged.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                merged[key] = _merge_summaries([current, value])
+            elif isinstance(current, list) and isinstance(value, list):
+                merged[key] = current + [v for v in value if v not in current]
+            elif not current:
+                merged[key] = value
+    return merged
+
+
+def generate_file_summaries_from_chunk(chunk: Iterable[Mapping[str, str]]) -> Dict[str, Dict[str, Any]]:
+    """
+    Generate per-file summaries for ``{"path", "content"}`` items.
+
+    Files are packed into as few kickoffs as fit in 80% of ``settings.MAX_CHARS``,
+    the summaries model's output cap and ``settings.SUMMARIES_BATCH_FILES``
+    files, and the kickoffs run concurrently. A file over the input budget is
+    split at line boundaries and the summaries of its parts are merged. ``chunk`` may be a generator: files are
+    consumed as batches are dispatched, so only the batches in flight are held
+    in memory. Files whose path and content were summarized before are served
+    from the summaries cache and never sent. Files missing from a batch's
+    result are retried alone.
+    Returns a JSON object mapping each input path to its summary.
+    """
+
+    # Imported on first use: loading the summaries crews and their output
+    # models is only paid by runs that actually summarize
+    from ..crews.summaries.file_summaries_crew import FileSummariesCrew
+    from ..crews.summaries.output_format.summaries import FILE_SUMMARIES_BATCH_SCHEMA
+
+    budget = int(settings.MAX_CHARS * 0.8)
+    summaries: Dict[str, Dict[str, Any]] = {}
+    keys: Dict[str, str] = {}
+    # Oversized files: path -> labels of its parts, and label -> path
+    parts_of: Dict[str, List[str]] = {}
+    part_paths: Dict[str, str] = {}
+    part_summaries: Dict[str, Dict[str, Any]] = {}
+
+    def _uncached_files() -> Iterator[Dict[str, str]]:
+        for item in chunk:
+            path, content = str(item["path"]), item["content"]
+            key = summary_key("file", path, content)
+            cached = load_summary(key)
+            if cached is not None:
+                summaries[path] = cached
+                continue
+            keys[path] = key
+            if len(path) + len(content) <= budget:
+                yield {"path": path, "content": content}
+                continue
+            for first, last, text in _split_lines(content, budget - len(path) - 32):
+                label = f"{path} (lines {first}-{last})"
+                parts_of.setdefault(path, []).append(label)
+                part_paths[label] = path
+                yield {"path": label, "content": text}
+
+    def _kickoff(batch: List[Dict[str, str]]) -> Dict[str, Dict[str, Any]]:
+        result = _summaries_crew(FileSummariesCrew).kickoff(inputs={"code_chunk": batch})
+        return {
+            entry["path"]: entry["summary"]
+            for entry in load_json_list(result, FILE_SUMMARIES_BATCH_SCHEMA)
+            if isinstance(entry, dict) and entry.get("path") and isinstance(entry.get("summary"), dict)
+        }
+
+    def _summarize(batch: List[Dict[str, str]]) -> Dict[str, Dict[str, Any]]:
+        generated = _kickoff(batch)
+        if len(batch) == 1:
+            # A lone file is unambiguous even if its path was not echoed exactly
+            path = batch[0]["path"]
+            if path not in generated and len(generated) == 1:
+                generated = {path: next(iter(generated.values()))}
+            return {path: generated[path]} if path in generated else {}
+        # Results are keyed by the paths the model echoes back: files it
+        # dropped or renamed are summarized again, one per kickoff. The task
+        # excludes __init__.py files, so those are not retried
+        found = {file["path"]: generated[file["path"]] for file in batch if file["path"] in generated}
+        for file in batch:
+            if file["path"] not in found and Path(file["path"]).name != "__init__.py":
+                found.update(_summarize([file]))
+        return found
+
+    files = _uncached_files()
+    batches = _pack_files(files, budget, max(1, settings.SUMMARIES_BATCH_FILES))
+    # Batches are independent: run their kickoffs concurrently
+    for generated in map_concurrently(_summarize, batches):
+        for path, summary in generated.items():
+            if path in part_paths:
+                part_summaries[path] = summary
+                continue
+            summaries[path] = summary
+            store_summary(keys[path], summary)
+    # A split file is summarized only when every part was
+    for path, labels in parts_of.items():
+        if all(label in part_summaries for label in labels):
+            summaries[path] = _merge_summaries([part_summaries[label] for label in labels])
+            store_summary(keys[path], summaries[path])
+    return summaries
 
 
 def generate_module_summaries_from_file_summaries(file_summaries: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
@@ -27,11 +217,22 @@ def generate_module_summaries_from_file_summaries(file_summaries: Dict[str, Dict
 
     The provided mapping should associate file identifiers (paths) with their
     corresponding JSON summaries (objects). No real code is included.
+    The result is cached under the hash of that mapping, so a module is only
+    summarized again when one of its file summaries changes.
     """
 
-    result = ModuleSummariesCrew().crew().kickoff(inputs={
+    from ..crews.summaries.module_summaries_crew import ModuleSummariesCrew
+    from ..crews.summaries.output_format.summaries import MODULE_SUMMARIES_SCHEMA
+
+    key = summary_key("module", orjson.dumps(file_summaries, option=orjson.OPT_SORT_KEYS, default=str).decode("utf-8"))
+    cached = load_summary(key)
+    if cached is not None:
+        return cached
+    result = _summaries_crew(ModuleSummariesCrew).kickoff(inputs={
         "invidual_summaries": file_summaries,
     })
     module_summaries = load_json_output(result, MODULE_SUMMARIES_SCHEMA)
+    if isinstance(module_summaries, dict) and module_summaries:
+        store_summary(key, module_summaries)
 
     return module_summaries
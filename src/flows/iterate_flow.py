@@ -1,17 +1,26 @@
 from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 import os
 import configparser
-from typing import Dict, Any, List, Set
+import hashlib
+from typing import Dict, Any, Iterable, Iterator, List, Set, Tuple
 import shutil
+import orjson
 import yaml
 from crewai.flow import Flow, start, listen
 
 from ..crews.docs_diff.output_format.doc_unified_diff import DOC_UNIFIED_DIFF_SCHEMA
-from .utils import ensure_repo, load_json_output, load_json_list, load_json_object
+from .utils import ensure_repo, load_json_output, load_json_list, load_json_object, guess_path_mapping
 from ..crews.project_structure.crew import ProjectStructureCrew
-from ..crews.project_structure.output_format.project_structure import PROJECT_STRUCTURE_SCHEMA
-from .utils import to_yaml_file_map, write_file
+from ..crews.project_structure.output_format.project_structure import (
+    PROJECT_STRUCTURE_SCHEMA,
+    ProjectStructureOutput,
+)
+from .utils import to_yaml_file_map, write_file, map_concurrently, read_texts
+from ..utils.files import walk_files
 from .utils import apply_combined_unified_diffs, extract_diffs_by_file, collect_module_dirs_from_diffs_map
 from .common import (
     generate_file_summaries_from_chunk,
@@ -41,7 +50,6 @@ from ..crews.tests_planning.crew import (
     LeadTestsPlanningCrew,
 )
 from ..crews.tests_relevance.crew import TestsRelevanceCrew
-from .utils import load_json_list, load_json_output
 from ..crews.tests_relevance.output_format.relevant_tests import RELEVANT_TESTS_SCHEMA
 from ..crews.tests_planning.output_format.test_plan import TEST_PLAN_SCHEMA
 from ..crews.tests_implementation.crew import (
@@ -59,7 +67,7 @@ from ..tools.file_system import (
     move_file,
     copy_file,
 )
-from ..tools.rag_tools import DocsRAG
+from ..tools.rag_tools import get_docs_rag
 from .release_notes import update_release_notes
 from .. import settings
 from ..crews.docs_relevance.crew import DocsRelevanceCrew
@@ -67,6 +75,19 @@ from ..crews.docs_relevance.output_format.relevant_docs import RELEVANT_DOCS_SCH
 from ..crews.docs_diff.crew import DocsDiffCrew
 
 
+# Next to the summaries: src mtimes at summary time, to detect stale summaries
+_SUMMARIES_INDEX = ".index.json"
+
+
+@dataclass(frozen=True, slots=True)
+class FileEntry:
+    """A source file with its src-relative path and summary path, derived once."""
+
+    path: Path
+    rel: str
+    summary_path: Path
+
+
 class IterateFlow(Flow):
     """
     CrewAI Flow for iterating on existing projects.
@@ -76,32 +97,34 @@ class IterateFlow(Flow):
     2. Execute IterateCrew with flow-level limits and guardrails
     """
 
-    def _process_file_summaries_chunk(self, chunk: List[Dict[str, str]]) -> Dict[str, str]:
+    def _process_file_summaries_chunk(self, chunk: Iterable[Dict[str, str]]) -> Dict[str, str]:
         return generate_file_summaries_from_chunk(chunk)
 
     def _process_module_summaries_from_file_summaries(self, file_summaries: Dict[str, str]) -> Dict[str, str]:
         return generate_module_summaries_from_file_summaries(file_summaries)
 
-    def _collect_module_file_summaries_from_py_paths(self, module_dir: Path, py_paths: List[Path]) -> Dict[str, str]:
+    def _collect_module_file_summaries_from_py_paths(
+        self, module_files: List[FileEntry], known: Dict[str, str] | None = None
+    ) -> Dict[str, str]:
         """
         Build a mapping of repo-relative Python paths -> file summary (YAML content)
-        for all files under the provided module directory, using existing per-file
-        summaries located under self.summaries_dir.
+        for the file entries of one module directory, using existing per-file
+        summaries located under self.summaries_dir. Summaries already in ``known``
+        (e.g. just generated) are not read back from disk.
         """
         chunk: Dict[str, str] = {}
         if not self.summaries_dir:
             return chunk
-        module_files = [p for p in py_paths if p.parent == module_dir]
-        for py_file in module_files:
-            rel_py = py_file.relative_to(self.src_dir)
-            yaml_file = (self.summaries_dir / rel_py).with_suffix(".yaml")
-            if not yaml_file.exists():
-                continue
-            try:
-                yaml_content = yaml_file.read_text(encoding="utf-8")
-            except Exception:
-                continue
-            chunk[str(rel_py)] = yaml_content
+        known = known or {}
+        # The other summaries are read on a thread pool; a missing summary
+        # fails the read, so there is no separate exists() stat
+        read = dict(read_texts(entry.summary_path for entry in module_files if entry.rel not in known))
+        for entry in module_files:
+            yaml_content = known.get(entry.rel)
+            if yaml_content is None:
+                yaml_content = read.get(entry.summary_path)
+            if yaml_content is not None:
+                chunk[entry.rel] = yaml_content
         return chunk
 
     def _collect_module_file_summaries(self, yaml_dir: Path) -> Dict[str, str]:
@@ -112,12 +135,9 @@ class IterateFlow(Flow):
         chunk: Dict[str, str] = {}
         if not self.summaries_dir or not yaml_dir.exists() or not yaml_dir.is_dir():
             return chunk
-        for yaml_file in yaml_dir.glob("*.yaml"):
-            if yaml_file.name == "_module.yaml":
-                continue
-            try:
-                yaml_content = yaml_file.read_text(encoding="utf-8")
-            except Exception:
+        yaml_files = (p for p in yaml_dir.glob("*.yaml") if p.name != "_module.yaml")
+        for yaml_file, yaml_content in read_texts(yaml_files):
+            if yaml_content is None:
                 continue
             rel_yaml = yaml_file.relative_to(self.summaries_dir)
             rel_py = str(Path(rel_yaml).with_suffix(".py"))
@@ -247,27 +267,44 @@ class IterateFlow(Flow):
             # Best-effort reader; ignore errors
             pass
 
-    def _regenerate_single_file_summary(self, code_path: Path, new_file_content: str) -> None:
+    def _regenerate_file_summaries(self, code_paths: Iterable[Path]) -> List[Tuple[str, int]]:
         """
-        Delete and regenerate the per-file summary for a given repo-relative Python file
-        path using the provided latest file content.
+        Regenerate the per-file summaries of the given Python files under src_dir
+        from their current content, batched into as few crew calls as fit.
+        Returns the src-relative path and mtime (ns) of each summary written.
         """
         if not self.summaries_dir:
-            return
-        summary_path = self.summaries_dir / code_path.relative_to(self.src_dir).with_suffix(".yaml")
-        regenerated = self._process_file_summaries_chunk(new_file_content)
-        if regenerated:
-            if summary_path.exists():
-                try:
-                    summary_path.unlink()
-                except Exception:
-                    pass
-            write_file(to_yaml_file_map(regenerated), summary_path)
+            return []
+        rels: Dict[str, Path] = {}
+        for code_path in code_paths:
+            try:
+                rels[str(code_path.relative_to(self.src_dir))] = code_path
+            except ValueError:
+                continue
+
+        def _files() -> Iterator[Dict[str, str]]:
+            for rel, (_, content) in zip(rels, read_texts(rels.values())):
+                if content is not None:
+                    yield {"path": rel, "content": content}
+
+        written: List[Tuple[str, int]] = []
+        for rel, regenerated in self._process_file_summaries_chunk(_files()).items():
+            code_path = rels.get(rel)
+            if code_path is None or not regenerated:
+                continue
+            try:
+                write_file(to_yaml_file_map(regenerated), (self.summaries_dir / rel).with_suffix(".yaml"))
+                written.append((rel, code_path.stat().st_mtime_ns))
+            except Exception:
+                continue
+        return written
 
     def _get_test_inputs_payload(self) -> Dict[str, Any]:
         payload = {}
         if self.test_dirs and len(self.test_dirs) > 0:
-            self.test_file_paths = sorted(str(p) for test_dir in self.test_dirs for p in test_dir.glob("**/*.py"))
+            self.test_file_paths = sorted(
+                str(p) for test_dir in self.test_dirs for p in walk_files(test_dir, (".py",))[".py"]
+            )
             payload = {
                 "framework": self.test_framework or "",
                 "command": self.test_command or "",
@@ -328,28 +365,85 @@ class IterateFlow(Flow):
             "user_prompt": user_prompt,
         }
 
+    def _src_py_paths(self, repo_py_paths: List[Path]) -> List[Path]:
+        """
+        Python files under src_dir, excluding __init__.py, taken from the repo
+        walk when src_dir lies inside the repo (walked on its own otherwise).
+        """
+        if self.src_dir == self.repo_dir or self.repo_dir in self.src_dir.parents:
+            candidates = [p for p in repo_py_paths if self.src_dir in p.parents]
+        else:
+            candidates = walk_files(self.src_dir, (".py",))[".py"]
+        return [p for p in candidates if p.name != "__init__.py"]
+
+    @staticmethod
+    def _load_cached_structure(path: Path) -> Dict[str, Any] | None:
+        """Cached ProjectStructure result, or None if missing or not a valid result."""
+        try:
+            return ProjectStructureOutput.model_validate(orjson.loads(path.read_bytes())).model_dump()
+        except Exception:
+            return None
+
+    @staticmethod
+    def _store_cached_structure(path: Path, structure: Any) -> None:
+        """Persist a valid ProjectStructure crew result atomically; best-effort."""
+        try:
+            data = ProjectStructureOutput.model_validate(structure).model_dump()
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(".tmp")
+            tmp.write_bytes(orjson.dumps(data))
+            os.replace(tmp, path)
+        except Exception:
+            pass
+
+    def _load_summaries_index(self) -> Dict[str, int]:
+        """Source mtime (ns) of each src-relative file when its summary was written."""
+        try:
+            data = orjson.loads((self.summaries_dir / _SUMMARIES_INDEX).read_bytes())
+        except Exception:
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _store_summaries_index(self, index: Dict[str, int]) -> None:
+        """Persist the summaries index atomically; best-effort."""
+        path = self.summaries_dir / _SUMMARIES_INDEX
+        try:
+            tmp = path.with_suffix(".tmp")
+            tmp.write_bytes(orjson.dumps(index, option=orjson.OPT_SORT_KEYS))
+            os.replace(tmp, path)
+        except Exception:
+            pass
+
     @listen(process_inputs)
     def identify_project_structure(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
 
-        # Collect relevant files using glob: .py, .md, .rst
-        patterns = ["**/*.md", "**/*.rst", "**/*.txt", "**/*.mdx"]
-        repo_py_files_list = sorted(str(p) for p in self.repo_dir.glob("**/*.py"))
-        file_list = sorted(str(p) for pat in patterns for p in self.repo_dir.glob(pat))
+        # Collect relevant files (.py and docs) in a single walk of the repo; the
+        # docs and the Python files are each sorted once, as strings
+        by_suffix = walk_files(self.repo_dir, (".py", ".md", ".rst", ".txt", ".mdx"), sort=False)
+        repo_py_paths = by_suffix.pop(".py")
+        repo_py_files_list = sorted(map(str, repo_py_paths))
+        file_list = sorted(str(p) for paths in by_suffix.values() for p in paths)
         file_list.extend(repo_py_files_list)
 
         # If pydev.yaml already provided structure, skip detection
         if self.src_dir and self.src_dir.exists() and self.test_dirs:
-            py_paths = [p for p in self.src_dir.rglob("*.py") if p.name != "__init__.py"]
+            py_paths = self._src_py_paths(repo_py_paths)
             return {**inputs, "file_list": file_list, "py_paths": py_paths, "repo_py_files_list": repo_py_files_list}
 
-        # 2) Fallback: Run the ProjectStructure crew
-        result = ProjectStructureCrew().crew().kickoff(
-            inputs={
-                "files": file_list,
-            }
+        # 2) Fallback: Run the ProjectStructure crew, unless this exact file list
+        # was already classified (e.g. a repo without test dirs on every run)
+        structure_cache = self.pydev_dir / "cache" / "structure" / (
+            hashlib.blake2b("\n".join(file_list).encode("utf-8"), digest_size=16).hexdigest() + ".json"
         )
-
-        structure = load_json_output(result, PROJECT_STRUCTURE_SCHEMA, 0)
+        structure = self._load_cached_structure(structure_cache)
+        if structure is None:
+            result = ProjectStructureCrew().crew().kickoff(
+                inputs={
+                    "files": file_list,
+                }
+            )
+            structure = load_json_output(result, PROJECT_STRUCTURE_SCHEMA, 0)
+            self._store_cached_structure(structure_cache, structure)
         self.src_dir = Path(structure["code_dir"]).resolve()
         self.docs_dir = Path(structure["docs_dir"]).resolve() if structure["docs_dir"] else None
         self.test_dirs = [Path(test_dir).resolve() for test_dir in structure["test_dirs"]]
@@ -358,7 +452,7 @@ class IterateFlow(Flow):
         # Snapshot after discovering structure and enforcing dirs
         self._write_pydev_snapshot()
         # Collect Python files excluding __init__.py
-        py_paths = [p for p in self.src_dir.rglob("*.py") if p.name != "__init__.py"]
+        py_paths = self._src_py_paths(repo_py_paths)
         return {**inputs, "file_list": file_list, "py_paths": py_paths, "repo_py_files_list": repo_py_files_list}
 
     @listen(identify_project_structure)
@@ -457,63 +551,94 @@ class IterateFlow(Flow):
 
         py_paths = inputs["py_paths"]
 
-        # 1) Check and generate missing FILE summaries
-        missing_file_rel_paths: list[str] = []
+        # Index files by module folder (parent) once, with the src-relative path
+        # and summary path of each, so no later step re-derives or re-scans them
+        files_by_dir: Dict[Path, List[FileEntry]] = {}
         for py_path in py_paths:
             rel = py_path.relative_to(self.src_dir)
-            expected_md = (self.summaries_dir / rel).with_suffix(".yaml")
-            if not expected_md.exists():
-                missing_file_rel_paths.append(str(rel))
-
-        new_file_summaries: Dict[str, Any] = {}
-        if missing_file_rel_paths:
-            # Agrupar por módulo (carpeta) y hacer una única llamada por módulo
-            py_paths = inputs["py_paths"]
-            module_dirs = sorted({p.parent for p in py_paths})
-            missing_set = set(missing_file_rel_paths)
-            for module_dir in module_dirs:
-                # Archivos faltantes dentro de este módulo
-                rel_missing_in_module: list[str] = [
-                    str(p.relative_to(self.src_dir))
-                    for p in py_paths
-                    if p.parent == module_dir and str(p.relative_to(self.src_dir)) in missing_set
-                ]
-                if not rel_missing_in_module:
+            files_by_dir.setdefault(py_path.parent, []).append(
+                FileEntry(py_path, str(rel), (self.summaries_dir / rel).with_suffix(".yaml"))
+            )
+
+        # Existing summaries come from one walk of the summaries tree instead of
+        # an exists() stat per file and per module
+        existing = {str(p) for p in walk_files(self.summaries_dir, (".yaml",), prune=False)[".yaml"]}
+
+        # 1) Check and generate missing or stale FILE summaries. A summary is
+        # stale once its file was modified after it was written; summaries
+        # predating the index are taken as current
+        stored_index = self._load_summaries_index()
+        index: Dict[str, int] = {}
+        mtimes: Dict[str, int] = {}
+        missing_files: List[FileEntry] = []
+        for entries in files_by_dir.values():
+            for entry in entries:
+                try:
+                    mtime = entry.path.stat().st_mtime_ns
+                except OSError:
                     continue
-                for rel_str in rel_missing_in_module:
-                    code_path = (self.src_dir / rel_str).resolve()
-                    try:
-                        content = code_path.read_text(encoding="utf-8")
-                    except Exception:
-                        continue
-                    generated = self._process_file_summaries_chunk(content)
-                    if generated:
-                        yaml_dir = (self.summaries_dir / rel_str).with_suffix(".yaml")
-                        write_file(to_yaml_file_map(generated), yaml_dir)
-                        new_file_summaries.update(generated)
+                mtimes[entry.rel] = mtime
+                index[entry.rel] = stored_index.get(entry.rel, mtime)
+                if str(entry.summary_path) not in existing or mtime > index[entry.rel]:
+                    missing_files.append(entry)
+
+        # YAML text of the summaries written below, reused as module input
+        new_file_summaries: Dict[str, str] = {}
+        # Modules with a regenerated file summary get their module summary regenerated too
+        refreshed_dirs: set[Path] = set()
+        if missing_files:
+            missing_by_rel = {entry.rel: entry for entry in missing_files}
+            # Batch every missing file; the crew packs them into as few calls as fit.
+            # Files are read lazily, as their batch is dispatched
+            def _missing_files() -> Iterator[Dict[str, str]]:
+                contents = read_texts(entry.path for entry in missing_files)
+                for entry, (_, content) in zip(missing_files, contents):
+                    if content is not None:
+                        yield {"path": entry.rel, "content": content}
+
+            for rel_str, generated in self._process_file_summaries_chunk(_missing_files()).items():
+                entry = missing_by_rel.get(rel_str)
+                if entry is None:
+                    continue
+                text = to_yaml_file_map(generated)
+                write_file(text, entry.summary_path)
+                new_file_summaries[rel_str] = text
+                index[rel_str] = mtimes[rel_str]
+                if str(entry.summary_path) in existing:
+                    refreshed_dirs.add(entry.path.parent)
+        # Rebuilt from the current files, so deleted files drop out of the index
+        if index != stored_index:
+            self._store_summaries_index(index)
 
         # 2) Check and generate missing MODULE summaries using existing file summaries
-        # Determine module folders (parents of Python files)
-        module_dirs = sorted({p.parent for p in py_paths})
+        # Module folders are the parents of Python files
+        module_dirs = sorted(files_by_dir)
         missing_module_dirs: list[Path] = []
         for folder in module_dirs:
             rel_dir = folder.relative_to(self.src_dir)
-            expected_module_yaml = (self.summaries_dir / rel_dir / "_module.yaml").resolve()
-            if not expected_module_yaml.exists():
+            expected_module_yaml = self.summaries_dir / rel_dir / "_module.yaml"
+            if str(expected_module_yaml) not in existing or folder in refreshed_dirs:
                 missing_module_dirs.append((expected_module_yaml, folder))
 
         new_module_summaries: Dict[str, Any] = {}
         if missing_module_dirs:
-            for module_dir_yaml, src_module_dir in missing_module_dirs:
+            def _generate_module_summary(item: Tuple[Path, Path]) -> Dict[str, Any]:
+                module_dir_yaml, src_module_dir = item
                 # Build input using only the file summaries within this module directory
-                chunk: Dict[str, str] = self._collect_module_file_summaries_from_py_paths(src_module_dir, py_paths)
+                chunk: Dict[str, str] = self._collect_module_file_summaries_from_py_paths(
+                    files_by_dir[src_module_dir], new_file_summaries
+                )
                 if not chunk:
-                    continue
+                    return {}
                 generated = self._process_module_summaries_from_file_summaries(chunk)
                 if generated:
                     # Persist each module summary immediately (intermediate save)
                     write_file(to_yaml_file_map(generated), module_dir_yaml)
-                    new_module_summaries.update(generated)
+                return generated or {}
+
+            # Modules are independent: one crew per module, run concurrently
+            for generated in map_concurrently(_generate_module_summary, missing_module_dirs):
+                new_module_summaries.update(generated)
 
         return {
             "user_prompt": inputs["user_prompt"],
@@ -525,12 +650,10 @@ class IterateFlow(Flow):
         module_summaries: Dict[str, str] = {}
         if not self.summaries_dir:
             return inputs
-        for yaml_path in self.summaries_dir.rglob("_module.yaml"):
-            try:
-                rel = str(yaml_path.relative_to(self.summaries_dir))
-                module_summaries[rel] = yaml_path.read_text(encoding="utf-8")
-            except Exception:
-                continue
+        module_yamls = (p for p in walk_files(self.summaries_dir, (".yaml",), prune=False)[".yaml"] if p.name == "_module.yaml")
+        for yaml_path, content in read_texts(module_yamls):
+            if content is not None:
+                module_summaries[str(yaml_path.relative_to(self.summaries_dir))] = content
 
         # Use RelevanceCrew to select relevant file summary paths
         user_prompt = inputs["user_prompt"]
@@ -543,21 +666,35 @@ class IterateFlow(Flow):
 
         # Phase 2: load relevant file summaries content deterministically
         relevant_map: Dict[str, str] = {}
+        yaml_files: Dict[Path, str] = {}
         for rel_py in relevant_paths:
-            yaml_file = (self.summaries_dir / Path(rel_py).relative_to(self.src_dir)).with_suffix(".yaml").resolve()
             try:
-                if yaml_file.exists():
-                    rel_md = str(yaml_file.relative_to(self.summaries_dir))
-                    relevant_map[rel_md] = yaml_file.read_text(encoding="utf-8")
+                yaml_file = (self.summaries_dir / Path(rel_py).relative_to(self.src_dir)).with_suffix(".yaml").resolve()
+                yaml_files[yaml_file] = str(yaml_file.relative_to(self.summaries_dir))
             except Exception:
                 continue
+        for yaml_file, content in read_texts(yaml_files):
+            if content is not None:
+                relevant_map[yaml_files[yaml_file]] = content
+
+        def _code_path(rel_yaml: str) -> Path:
+            # Convert summaries path like "pkg/mod/file.yaml" -> source file path under src_dir
+            src_rel = rel_yaml[:-5] if rel_yaml.endswith(".yaml") else rel_yaml
+            return (self.src_dir / src_rel).with_suffix(".py").resolve()
 
+        code_texts: Dict[Path, str | None] = {}
         if relevant_map:
-            # Classify into summaries_only and need_code
-            detail_result = FileDetailCrew().crew().kickoff(inputs={
-                "user_prompt": user_prompt,
-                "relevant_file_summaries": relevant_map,
-            })
+            # need_code is picked among the relevant files: prefetch their code
+            # while FileDetailCrew decides, so it is in memory when needed
+            candidates = [_code_path(rel_yaml) for rel_yaml in relevant_map]
+            with ThreadPoolExecutor(max_workers=1) as prefetcher:
+                prefetched = prefetcher.submit(lambda: dict(read_texts(candidates)))
+                # Classify into summaries_only and need_code
+                detail_result = FileDetailCrew().crew().kickoff(inputs={
+                    "user_prompt": user_prompt,
+                    "relevant_file_summaries": relevant_map,
+                })
+            code_texts = prefetched.result()
             detail = load_json_object(detail_result, FILE_DETAIL_SCHEMA)
             summaries_only: List[str] = detail.get("summaries_only", [])
             need_code: List[str] = detail.get("need_code", [])
@@ -565,19 +702,21 @@ class IterateFlow(Flow):
             summaries_only = []
             need_code = []
 
-        # Deterministically read code for the need_code set (map file.yaml -> {code,path})
+        # Deterministically read code for the need_code set (map file.yaml -> {code,path});
+        # only paths outside the prefetched set hit the disk here
         code_map: Dict[str, str] = {}
-        for rel_yaml in need_code:
-            # Convert summaries path like "pkg/mod/file.yaml" -> source file path under src_dir
-            src_rel = rel_yaml[:-5] if rel_yaml.endswith(".yaml") else rel_yaml
-            code_file = (self.src_dir / src_rel).with_suffix(".py").resolve()
+        code_files = [_code_path(rel_yaml) for rel_yaml in need_code]
+        code_texts.update(read_texts(f for f in code_files if f not in code_texts))
+        for code_file in code_files:
+            content = code_texts[code_file]
+            if content is None:
+                continue
             try:
-                if code_file.exists():
-                    code_map[str(code_file.relative_to(self.src_dir))] = code_file.read_text(encoding="utf-8")
-            except Exception:
+                code_map[str(code_file.relative_to(self.src_dir))] = content
+            except ValueError:
                 continue
 
-        file_list = sorted(str(p) for p in self.src_dir.glob("**/*.py"))
+        file_list = [str(p) for p in walk_files(self.src_dir, (".py",))[".py"]]
 
         # Phase 3: generate action plan
         plan_result = ActionPlanCrew().crew().kickoff(inputs={
@@ -618,25 +757,30 @@ class IterateFlow(Flow):
             return str((self.repo_dir / p).resolve())
 
         # --- Helpers to mirror operations into summaries directory ---
-        def _is_py_file_under_src(abs_path: str) -> bool:
+        @lru_cache(maxsize=4096)
+        def _src_rel(abs_path: str) -> Path | None:
+            """src-relative path of ``abs_path``; each distinct path is resolved once."""
             try:
-                p = Path(abs_path).resolve()
-                # Must be under src_dir
-                _ = p.relative_to(self.src_dir)
+                return Path(abs_path).resolve().relative_to(self.src_dir)
             except Exception:
-                return False
-            return p.suffix == ".py" and p.name != "__init__.py"
+                return None
+
+        def _is_py_file_under_src(abs_path: str) -> bool:
+            rel = _src_rel(abs_path)
+            return rel is not None and rel.suffix == ".py" and rel.name != "__init__.py"
 
         def _summary_path_for_code(abs_path: str) -> Path | None:
             if not self.summaries_dir:
                 return None
-            p = Path(abs_path).resolve()
-            try:
-                rel = p.relative_to(self.src_dir)
-            except Exception:
+            rel = _src_rel(abs_path)
+            if rel is None:
                 return None
             return (self.summaries_dir / rel).with_suffix(".yaml")
 
+        def _mark_module_for_refresh(abs_path: str) -> None:
+            if _is_py_file_under_src(abs_path):
+                modules_to_refresh.add(_src_rel(abs_path).parent)
+
         def _mirror_delete_files(file_paths: List[str]) -> None:
             if not self.summaries_dir:
                 return
@@ -644,9 +788,9 @@ class IterateFlow(Flow):
                 if not _is_py_file_under_src(fp):
                     continue
                 sp = _summary_path_for_code(fp)
-                if sp and sp.exists():
+                if sp:
                     try:
-                        sp.unlink()
+                        sp.unlink(missing_ok=True)
                     except Exception:
                         pass
 
@@ -654,29 +798,23 @@ class IterateFlow(Flow):
             if not self.summaries_dir:
                 return
             for dp in dir_paths:
-                try:
-                    p = Path(dp).resolve()
-                    rel = p.relative_to(self.src_dir)
-                except Exception:
+                rel = _src_rel(dp)
+                if rel is None:
                     continue
-                target_dir = (self.summaries_dir / rel).resolve()
+                target_dir = self.summaries_dir / rel
                 target_dir.mkdir(parents=True, exist_ok=True)
 
         def _mirror_delete_dirs(dir_paths: List[str]) -> None:
             if not self.summaries_dir:
                 return
             for dp in dir_paths:
+                rel = _src_rel(dp)
+                if rel is None:
+                    continue
                 try:
-                    p = Path(dp).resolve()
-                    rel = p.relative_to(self.src_dir)
+                    shutil.rmtree(self.summaries_dir / rel)
                 except Exception:
-                    continue
-                target_dir = (self.summaries_dir / rel).resolve()
-                if target_dir.exists():
-                    try:
-                        shutil.rmtree(target_dir)
-                    except Exception:
-                        pass
+                    pass
 
         def _mirror_move_file(src: str, dst: str, op: str) -> None:
             if not self.summaries_dir:
@@ -689,18 +827,17 @@ class IterateFlow(Flow):
             if not sp_dst:
                 return
             sp_dst.parent.mkdir(parents=True, exist_ok=True)
-            if sp_src and sp_src.exists():
-                try:
-                    if op in {"rename", "move"}:
-                        sp_src.rename(sp_dst)
-                    elif op == "copy":
-                        shutil.copy2(str(sp_src), str(sp_dst))
-                except Exception:
-                    # As a fallback, ensure destination exists
-                    if not sp_dst.exists():
-                        sp_dst.touch()
-            else:
-                # If source summary doesn't exist, create an empty destination summary
+            # No exists() pre-check: a missing source summary fails the operation
+            try:
+                if sp_src is None:
+                    raise FileNotFoundError(src)
+                if op in {"rename", "move"}:
+                    sp_src.rename(sp_dst)
+                elif op == "copy":
+                    # Plain content copy (sendfile on Linux); summary metadata is irrelevant
+                    shutil.copyfile(sp_src, sp_dst)
+            except Exception:
+                # Missing source summary or failed operation: ensure destination exists
                 if not sp_dst.exists():
                     sp_dst.touch()
 
@@ -713,7 +850,7 @@ class IterateFlow(Flow):
                     continue
                 # Try mirrored location: tests/<same_dir>/test_<module>.py
                 try:
-                    src_rel = Path(fp).resolve().relative_to(self.src_dir)
+                    src_rel = _src_rel(fp)
                     test_file_name = f"test_{src_rel.stem}.py"
                     for test_dir in self.test_dirs:
                         candidate = (test_dir / src_rel.parent / test_file_name).resolve()
@@ -730,9 +867,8 @@ class IterateFlow(Flow):
             if not self._should_test_be_modified():
                 return
             for dp in dir_paths:
-                try:
-                    rel = Path(dp).resolve().relative_to(self.src_dir)
-                except Exception:
+                rel = _src_rel(dp)
+                if rel is None:
                     continue
                 # TODO: añadir en el pydev.yaml un flag de si los tests estan generados como un mirror de los source files
                 # TODO: hace falta una crew que infiera la ruta
@@ -842,12 +978,7 @@ class IterateFlow(Flow):
                     _mirror_tests_delete_files(path_str)
                     deleted_files.append(delete_file(path_str))
                     # Mark affected modules for refresh
-                    if _is_py_file_under_src(path_str):
-                        try:
-                            rel = Path(path_str).resolve().relative_to(self.src_dir)
-                            modules_to_refresh.add(rel.parent)
-                        except Exception:
-                            pass
+                    _mark_module_for_refresh(path_str)
                 elif step_type == "Create new directory":
                     # Mirror summaries directory structure for created source directories
                     _mirror_create_dirs(path_str)
@@ -861,10 +992,13 @@ class IterateFlow(Flow):
                     _mirror_tests_delete_dirs(path_str)
                     deleted_dirs.append(delete_directory(path_str))
                 elif step_type == "Rename file":
-                    rm_result = RenameMappingCrew().crew().kickoff(inputs={
-                        "input": {"input_path": path_str},
-                    })
-                    rename_map = load_json_object(rm_result, RENAME_MAP_SCHEMA)
+                    # Paths named in the step resolve most mappings without an LLM call
+                    rename_map = guess_path_mapping(path_str, step)
+                    if not rename_map:
+                        rm_result = RenameMappingCrew().crew().kickoff(inputs={
+                            "input": {"input_path": path_str},
+                        })
+                        rename_map = load_json_object(rm_result, RENAME_MAP_SCHEMA)
                     if not rename_map:
                         continue
                     src = list(rename_map.keys())[0]
@@ -875,23 +1009,16 @@ class IterateFlow(Flow):
                     _mirror_tests_move_file(src, dst, step_plan=step)
                     # Perform rename and track
                     renamed.append(rename_file(src, dst))
-                    if _is_py_file_under_src(src):
-                        try:
-                            rel = Path(src).resolve().relative_to(self.src_dir)
-                            modules_to_refresh.add(rel.parent)
-                        except Exception:
-                            pass
-                    if _is_py_file_under_src(dst):
-                        try:
-                            rel = Path(dst).resolve().relative_to(self.src_dir)
-                            modules_to_refresh.add(rel.parent)
-                        except Exception:
-                            pass
+                    _mark_module_for_refresh(src)
+                    _mark_module_for_refresh(dst)
                 elif step_type == "Move file":
-                    mm_result = MoveMappingCrew().crew().kickoff(inputs={
-                        "input": {"input_path": path_str},
-                    })
-                    move_map = load_json_object(mm_result, MOVE_MAP_SCHEMA)
+                    # Paths named in the step resolve most mappings without an LLM call
+                    move_map = guess_path_mapping(path_str, step)
+                    if not move_map:
+                        mm_result = MoveMappingCrew().crew().kickoff(inputs={
+                            "input": {"input_path": path_str},
+                        })
+                        move_map = load_json_object(mm_result, MOVE_MAP_SCHEMA)
                     if not move_map:
                         continue
                     src = list(move_map.keys())[0]
@@ -902,23 +1029,16 @@ class IterateFlow(Flow):
                     _mirror_tests_move_file(src, dst, step_plan=step)
                     moved.append(move_file(src, dst))
                     # Mark both source and destination modules for refresh
-                    if _is_py_file_under_src(src):
-                        try:
-                            rel = Path(src).resolve().relative_to(self.src_dir)
-                            modules_to_refresh.add(rel.parent)
-                        except Exception:
-                            pass
-                    if _is_py_file_under_src(dst):
-                        try:
-                            rel = Path(dst).resolve().relative_to(self.src_dir)
-                            modules_to_refresh.add(rel.parent)
-                        except Exception:
-                            pass
+                    _mark_module_for_refresh(src)
+                    _mark_module_for_refresh(dst)
                 elif step_type == "Copy file":
-                    cm_result = CopyMappingCrew().crew().kickoff(inputs={
-                        "input": {"input_path": path_str},
-                    })
-                    copy_map = load_json_object(cm_result, COPY_MAP_SCHEMA)
+                    # Paths named in the step resolve most mappings without an LLM call
+                    copy_map = guess_path_mapping(path_str, step)
+                    if not copy_map:
+                        cm_result = CopyMappingCrew().crew().kickoff(inputs={
+                            "input": {"input_path": path_str},
+                        })
+                        copy_map = load_json_object(cm_result, COPY_MAP_SCHEMA)
                     if not copy_map:
                         continue
                     src = list(copy_map.keys())[0]
@@ -929,12 +1049,7 @@ class IterateFlow(Flow):
                     _mirror_tests_move_file(src, dst, step_plan=step)
                     copied.append(copy_file(src, dst))
                     # Mark destination modules for refresh
-                    if _is_py_file_under_src(dst):
-                        try:
-                            rel = Path(dst).resolve().relative_to(self.src_dir)
-                            modules_to_refresh.add(rel.parent)
-                        except Exception:
-                            pass
+                    _mark_module_for_refresh(dst)
                 elif step_type == "Modify code":
                     # Choose diff-based development crew by points (1=junior, 2=senior, 3=lead)
                     points = int(step.get("points", 1) or 1)
@@ -1054,40 +1169,41 @@ class IterateFlow(Flow):
                     "error": str(exc),
                 })
 
-        # For modified files: delete original summary and regenerate a new one (after git apply)
-        for path in files_changed:
-            try:
-                code_path = (self.src_dir / path).resolve()
-                updated_code = code_path.read_text(encoding="utf-8")
-            except Exception:
-                code_path = None
-                updated_code = ""
-            try:
-                if code_path is not None:
-                    self._regenerate_single_file_summary(code_path, updated_code)
-            except Exception:
-                pass
+        # For modified files: regenerate their summaries in one batched call (after git apply)
+        try:
+            refreshed = self._regenerate_file_summaries(
+                (self.src_dir / path).resolve() for path in sorted(files_changed)
+            )
+        except Exception:
+            refreshed = []
+        if refreshed:
+            # Record the regenerated summaries as current for the next run
+            index = self._load_summaries_index()
+            index.update(refreshed)
+            self._store_summaries_index(index)
 
 
 
         # Regenerate module summaries (_module.yaml) for affected modules
-        for module_rel in sorted(modules_to_refresh, key=lambda p: str(p)):
+        def _refresh_module_summary(module_rel: Path) -> None:
             try:
-                module_yaml_path = (self.summaries_dir / module_rel.relative_to(self.src_dir) / "_module.yaml").resolve()
+                module_yaml_path = self.summaries_dir / module_rel.relative_to(self.src_dir) / "_module.yaml"
                 if module_yaml_path.exists():
                     module_yaml_path.unlink()
                 module_yaml_path.parent.mkdir(parents=True, exist_ok=True)
                 # Build input chunk using only per-file summaries in this module directory (exclude _module.yaml)
                 chunk: Dict[str, str] = self._collect_module_file_summaries(module_yaml_path.parent)
                 if not chunk:
-                    continue
+                    return
                 generated = self._process_module_summaries_from_file_summaries(chunk)
                 if generated:
                     # Persist each module summary immediately (intermediate save)
                     write_file(to_yaml_file_map(generated), module_yaml_path)
             except Exception:
                 # Best-effort; do not fail the flow if module regen fails
-                continue
+                pass
+
+        map_concurrently(_refresh_module_summary, sorted(modules_to_refresh, key=lambda p: str(p)))
 
         execution_summary: Dict[str, Any] = {
             "created_files": created,
@@ -1131,7 +1247,7 @@ class IterateFlow(Flow):
             return {**inputs, "docs_candidates": []}
 
         # Initialize docs-only RAG and ensure index is up-to-date (incremental)
-        docs_rag = DocsRAG(repo_dir=self.repo_dir, docs_dir=self.docs_dir)
+        docs_rag = get_docs_rag(self.repo_dir, self.docs_dir)
         docs_rag.index()
 
         # Build richer context for RAG queries
@@ -1197,20 +1313,28 @@ class IterateFlow(Flow):
         })
         docs_candidates = load_json_list(docs_result, RELEVANT_DOCS_SCHEMA)
 
-        # Generate unified diffs for documentation per file and apply them
+        # Generate unified diffs for documentation per file, then apply them
+        doc_inputs: list[Tuple[Path, Dict[str, Any]]] = []
         for cand in docs_candidates or []:
             try:
                 cand_abs = Path(cand).resolve() if Path(cand).is_absolute() else (self.repo_dir / cand).resolve()
                 current_content = cand_abs.read_text(encoding="utf-8", errors="ignore")
             except Exception:
                 continue
-
-            dd_result = DocsDiffCrew().crew().kickoff(inputs={
+            doc_inputs.append((cand_abs, {
                 "user_prompt": user_prompt,
                 "action_plan": plan_text,
                 "doc_path": str(cand_abs.relative_to(self.repo_dir)),
                 "document_content": current_content,
-            })
+            }))
+
+        # Documents are independent: generate the diffs concurrently
+        dd_results = map_concurrently(
+            lambda item: DocsDiffCrew().crew().kickoff(inputs=item[1]),
+            doc_inputs,
+        )
+        # git apply runs one document at a time
+        for (cand_abs, _), dd_result in zip(doc_inputs, dd_results):
             unified_diff = load_json_output(dd_result, DOC_UNIFIED_DIFF_SCHEMA)
             ok, err = apply_combined_unified_diffs(self.repo_dir, self.repo_dir, {str(cand_abs): [unified_diff]})
             if not ok:
@@ -3,13 +3,15 @@ import pathlib
 import subprocess
 import sys
 import os
-from typing import Dict, Any, List, Tuple
-import glob
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
 from crewai.flow import Flow, start, listen
 from .utils import (
     ensure_repo, is_something_to_fix, write_file_map, sanitize_generated_content,
-    load_json_output, process_path,
+    load_json_output, process_path, read_text_cached, map_concurrently,
+    apply_unified_diffs_to_text,
 )
+from ..utils.files import walk_files
 from .common import (
     generate_file_summaries_from_chunk,
     generate_module_summaries_from_file_summaries,
@@ -27,7 +29,7 @@ from ..crews.debug import (
     BugAnalysisCrew,
     PytestOutputAnalysisCrew,
     AnalyzeInvolvedFilesCrew,
-    bug_fixer_for_points,
+    bug_fixer_batch,
 )
 from ..crews.design.output_format.task_assignment import TASK_ASSIGNMENT_SCHEMA
 from ..crews.development.output_format.generate_code import GENERATE_CODE_SCHEMA
@@ -116,7 +118,32 @@ class NewProjectFlow(Flow):
     def code_development(self, design_result: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Run code development."""
         code = {}
-        summaries = {}
+        # Summaries are written as each task produces them, on a single writer
+        # thread so the disk I/O overlaps with the next task's crews
+        summary_writes: List[Future] = []
+        with ThreadPoolExecutor(max_workers=1) as summaries_writer:
+            self._develop_tasks(design_result, code, summaries_writer, summary_writes)
+        summaries_log: List[Tuple[str, int]] = []
+        for write in summary_writes:
+            try:
+                summaries_log.extend(write.result())
+            except Exception as exc:
+                # Summaries can be regenerated: a failed write must not stop the flow
+                print(f"Writing summaries failed: {exc}")
+        print(f"Wrote {len(summaries_log)} summaries to .pydev/summaries")
+        return {
+            "code": code,
+            "project_design": design_result,
+        }
+
+    def _develop_tasks(
+        self,
+        design_result: List[Dict[str, Any]],
+        code: Dict[str, str],
+        summaries_writer: ThreadPoolExecutor,
+        summary_writes: List[Future],
+    ) -> None:
+        """Develop each task's files into ``code`` and queue its summaries for writing."""
         for development_task in design_result:
             result = DEVELOPERS[development_task["developer"]]().crew().kickoff(
                 inputs={
@@ -128,21 +155,27 @@ class NewProjectFlow(Flow):
                 continue
             code_fixes_output = load_json_output(result, DEBUG_IF_NEEDED_SCHEMA, 2)
 
-            for file in code_output:
-                file_fixes = [
+            fixes_by_path: Dict[str, List[Dict[str, Any]]] = {}
+            for fix in code_fixes_output:
+                fixes_by_path.setdefault(fix["file_path"], []).append(
                     {k: v for k, v in fix.items() if k != "file_path"}
-                    for fix in code_fixes_output if fix["file_path"] == file["path"]
-                ]
-                if file_fixes:
-                    fix_result = FixIntegratorCrew().crew().kickoff(
-                        inputs={
-                            "original_code": file["content"],
-                            "code_fixes": file_fixes,
-                        }
-                    )
-                    code[file["path"]] = sanitize_generated_content(str(fix_result.tasks_output[0]))
-                else:
-                    code[file["path"]] = sanitize_generated_content(file["content"])
+                )
+
+            def _integrate_fixes(file: Dict[str, Any]) -> str:
+                file_fixes = fixes_by_path.get(file["path"])
+                if not file_fixes:
+                    return sanitize_generated_content(file["content"])
+                fix_result = FixIntegratorCrew().crew().kickoff(
+                    inputs={
+                        "original_code": file["content"],
+                        "code_fixes": file_fixes,
+                    }
+                )
+                return sanitize_generated_content(str(fix_result.tasks_output[0]))
+
+            # Files are independent: integrate their fixes concurrently
+            for file, content in zip(code_output, map_concurrently(_integrate_fixes, code_output)):
+                code[file["path"]] = content
 
             # Generate summaries iteratively to avoid LLM output limits
             # 1) Per-file summaries (iterate item-by-item)
@@ -150,38 +183,29 @@ class NewProjectFlow(Flow):
 
             # 2) Per-module summaries built from file summaries only
             # Group file summaries by their parent folder
-            folders = set(pathlib.Path(p).parent for p in file_summaries_map.keys())
+            per_module_inputs: Dict[pathlib.Path, Dict[str, str]] = {}
+            for path, content in file_summaries_map.items():
+                per_module_inputs.setdefault(pathlib.Path(path).parent, {})[path] = content
+            # Modules are independent: fan out one crew per module, then merge
             module_summaries_map: Dict[str, str] = {}
-            for folder in folders:
-                per_module_input = {
-                    path: content
-                    for path, content in file_summaries_map.items()
-                    if pathlib.Path(path).parent == folder
-                }
-                if not per_module_input:
-                    continue
-                generated = self._process_module_summaries_from_file_summaries(per_module_input)
+            for generated in map_concurrently(
+                self._process_module_summaries_from_file_summaries,
+                per_module_inputs.values(),
+            ):
                 module_summaries_map.update(generated)
 
-            # 3) Accumulate
-            summaries.update(file_summaries_map)
-            summaries.update(module_summaries_map)
-        return {
-            "code": code,
-            "summaries": summaries,
-            "project_design": design_result,
-        }
+            # 3) Persist this task's summaries; only they are held in memory
+            summary_writes.append(summaries_writer.submit(
+                write_file_map,
+                {**file_summaries_map, **module_summaries_map},
+                self.out_dir,
+                '.pydev/summaries',
+            ))
 
     @listen(code_development)
     def write_generated_code(self, code_result: Dict[str, Any]) -> Dict[str, Any]:
         """Deterministically write the codebase."""
         code_logs = write_file_map(code_result["code"], self.out_dir, 'src')  # TODO: review the logs
-        # Ensure .pydev/summaries exists at repo root
-        summaries_logs = write_file_map(
-            code_result["summaries"],
-            self.out_dir,
-            '.pydev/summaries'
-        )  # TODO: review the logs
         return code_result["project_design"]
 
     @listen(write_generated_code)
@@ -334,19 +358,13 @@ class NewProjectFlow(Flow):
                 "debug_info": [],
             }
 
-        # Collect project and test Python files using glob
+        # Collect project and test Python files in one walk each
         repo_dir = pathlib.Path(self.out_dir)
         src_dir = repo_dir / "src"
         tests_dir = repo_dir / "tests"
 
-        code_files = sorted([
-            str(pathlib.Path(p).relative_to(repo_dir))
-            for p in glob.glob(str(src_dir / "**" / "*.py"), recursive=True)
-        ])
-        test_files = sorted([
-            str(pathlib.Path(p).relative_to(repo_dir))
-            for p in glob.glob(str(tests_dir / "**" / "*.py"), recursive=True)
-        ])
+        code_files = sorted(str(p.relative_to(repo_dir)) for p in walk_files(src_dir, (".py",))[".py"])
+        test_files = sorted(str(p.relative_to(repo_dir)) for p in walk_files(tests_dir, (".py",))[".py"])
 
         involved_files = AnalyzeInvolvedFilesCrew().crew().kickoff(
             inputs={
@@ -366,7 +384,7 @@ class NewProjectFlow(Flow):
             for p in file_list:
                 if str(p) not in file_contents:
                     try:
-                        content = process_path(repo_dir, p, "src").read_text(encoding="utf-8")
+                        content = read_text_cached(process_path(repo_dir, p, "src"))
                         file_contents[str(p)] = content
                     except Exception:
                         pass
@@ -400,20 +418,17 @@ class NewProjectFlow(Flow):
         files_to_write: Dict[str, str] = {}
         test_files_to_write: Dict[str, str] = {}
         changes_by_file: Dict[str, List[Dict[str, str]]] = {}
+        file_contents = debug_info.get("file_contents", {})
+        bugs: List[Dict[str, Any]] = []
         for bug in bug_analysis:
             bug = bug.copy()
             bug["file_contents"] = []
-            file_contents = debug_info.get("file_contents", {})
             for file_path in bug.get("file_paths", []):
                 if file_path in file_contents:
                     bug["file_contents"].append({"path": file_path, "content": file_contents[file_path]})
+            bugs.append(bug)
 
-            points = int(bug.get("points", 1) or 1)
-            fixer = bug_fixer_for_points(points)
-            result = fixer.crew().kickoff(inputs={
-                "bug": bug,
-                "debug_info": debug_info,
-            })
+        for result in bug_fixer_batch(bugs, debug_info):
             file_changes = load_json_output(result, BUG_FIXES_SCHEMA, 0)
 
             for file_change in file_changes:
@@ -421,9 +436,12 @@ class NewProjectFlow(Flow):
                 content_diff = file_change.get("content_diff", "")
                 if path not in changes_by_file:
                     changes_by_file[path] = []
-                changes_by_file[path].append(content_diff)
+                # Duplicated bugs share one fixer output: keep each diff once
+                if content_diff not in changes_by_file[path]:
+                    changes_by_file[path].append(content_diff)
 
-        for path, changes in changes_by_file.items():
+        def _integrate_changes(item: Tuple[str, List[str]]) -> Optional[str]:
+            path, changes = item
             try:
                 original_code = file_contents[path]
             except KeyError:
@@ -431,13 +449,28 @@ class NewProjectFlow(Flow):
                     original_code = file_contents[f'src/{path}']
                 except KeyError:
                     original_code = "-"
-            fix_result = FixIntegratorCrew().crew().kickoff(
-                inputs={
-                    "original_code": original_code,
-                    "code_fixes": changes,
-                }
-            )
-            file_result = sanitize_generated_content(str(fix_result.tasks_output[0]))
+            changes = [c for c in changes if isinstance(c, str) and c.strip()]
+            if not changes:
+                return None
+            # Non-overlapping diffs that match the known file are merged locally
+            file_result = None
+            if original_code != "-":
+                file_result = apply_unified_diffs_to_text(original_code, changes)
+            if file_result is None:
+                fix_result = FixIntegratorCrew().crew().kickoff(
+                    inputs={
+                        "original_code": original_code,
+                        "code_fixes": changes,
+                    }
+                )
+                file_result = sanitize_generated_content(str(fix_result.tasks_output[0]))
+            return file_result
+
+        # Files are independent: integrate their changes concurrently
+        items = list(changes_by_file.items())
+        for (path, _), file_result in zip(items, map_concurrently(_integrate_changes, items)):
+            if file_result is None:
+                continue
             if path.startswith('tests/'):
                 test_files_to_write[path] = file_result
             else:
@@ -7,9 +7,10 @@ import re
 import configparser
 from datetime import datetime, timezone
 
-from ..tools.rag_tools import DocsRAG
+from ..tools.rag_tools import get_docs_rag
 from ..crews.release_notes_update.crew import ReleaseNotesUpdateCrew
 from ..flows.utils import load_json_output
+from ..utils.files import is_ignored_dir
 from ..crews.docs_diff.output_format.doc_unified_diff import DOC_UNIFIED_DIFF_SCHEMA
 from .utils import apply_combined_unified_diffs
 
@@ -28,10 +29,10 @@ def _find_release_notes_file(
 
     def scan_for_candidates(root: Path) -> Optional[Path]:
         try:
-            # Walk and prune build directories
-            for dirpath, dirs, files in os.walk(str(root)):
-                # exclude 'build' directories from recursion
-                dirs[:] = [d for d in dirs if d != "build"]
+            # Walk and prune build, virtualenv and VCS directories
+            top = str(root)
+            for dirpath, dirs, files in os.walk(top):
+                dirs[:] = [d for d in dirs if not is_ignored_dir(dirpath, d, dirpath == top)]
                 for filename in files:
                     try:
                         p = Path(dirpath) / filename
@@ -82,7 +83,7 @@ def _find_release_notes_file(
     if p:
         return p
 
-    docs_rag = DocsRAG(repo_dir=repo_dir, docs_dir=docs_dir) if docs_dir else None
+    docs_rag = get_docs_rag(repo_dir, docs_dir) if docs_dir else None
     if docs_rag is not None:
         docs_rag.index()
         queries = ["release notes"]
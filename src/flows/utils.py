@@ -1,11 +1,17 @@
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, FIRST_EXCEPTION, Future, ThreadPoolExecutor, wait
+from functools import lru_cache
+from itertools import chain, islice
 from pathlib import Path
-from typing import Any, Dict, List, Tuple, Union, Set
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar, Union, Set
+import re
 import tempfile
 import subprocess
 from crewai import TaskOutput
-import json
+import orjson
 import yaml
 
+from .. import settings
 from ..summaries.storage import digests_root
 from ..summaries.summarizer import bootstrap_digest
 
@@ -14,10 +20,75 @@ from ..crews.diff_apply.crew import DiffApplyCrew
 from ..crews.diff_apply.output_format.full_file import FULL_FILE_SCHEMA
 
 
-def is_something_to_fix(output: TaskOutput) -> bool:
-    # "[]" is not a valid output
-    output = str(output)
-    return len(output) > 2  and '{' in output and '}' in output and 'error' in output
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def map_concurrently(fn: Callable[[T], R], items: Iterable[T], max_workers: Optional[int] = None) -> List[R]:
+    """
+    Apply ``fn`` to every item on a thread pool (crew kickoffs are I/O bound)
+    and return the results in input order. Items are pulled lazily, with at
+    most two per worker in flight, so a generator of large inputs is never
+    fully materialized. The first exception propagates to the caller, and
+    items that have not started yet are cancelled so no more LLM calls are
+    spent on a failed fan-out.
+    """
+    workers = max(1, max_workers or settings.MAX_CONCURRENT_CREWS)
+    iterator = iter(items)
+    head = list(islice(iterator, 2))
+    if len(head) <= 1 or workers == 1:
+        return [fn(item) for item in chain(head, iterator)]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures: List[Future] = []
+        pending: Set[Future] = set()
+
+        def _raise_failure(done: Set[Future]) -> None:
+            for future in done:
+                if future.exception() is not None:
+                    for other in pending:
+                        other.cancel()
+                    raise future.exception()
+
+        for item in chain(head, iterator):
+            if len(pending) >= 2 * workers:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                _raise_failure(done)
+            future = executor.submit(fn, item)
+            futures.append(future)
+            pending.add(future)
+        done, pending = wait(pending, return_when=FIRST_EXCEPTION)
+        _raise_failure(done)
+        return [future.result() for future in futures]
+
+
+def output_text(output: Any) -> str:
+    """Raw text of a task output, avoiding re-serialization when possible."""
+    raw = getattr(output, "raw", None)
+    return raw if isinstance(raw, str) else str(output)
+
+
+@lru_cache(maxsize=256)
+def has_json_with(text: str, token: str) -> bool:
+    """
+    True when ``text`` has a '{', then ``token``, then a '}'.
+    A single forward scan: each search resumes where the previous one matched.
+    """
+    start = text.find('{')
+    if start < 0:
+        return False
+    pos = text.find(token, start + 1)
+    if pos < 0:
+        return False
+    return text.find('}', pos + len(token)) >= 0
+
+
+def is_something_to_fix(output: TaskOutput, required_token: str = 'error') -> bool:
+    """
+    Condition for tasks that only run when the previous output is a JSON
+    object mentioning ``required_token`` ("[]" is not a valid output).
+    Bind other tokens with ``functools.partial``.
+    """
+    return has_json_with(output_text(output), required_token)
 
 
 def sanitize_generated_content(text: str) -> str:
@@ -151,21 +222,21 @@ def load_json_output(result: TaskOutput, schema: str, task: int = -1) -> List[Di
     """
     Parse the JSON output from a given schema.
     """
-    if result.tasks_output[task].json_dict is not None:
-        if "root" in result.tasks_output[task].json_dict:
-            return result.tasks_output[task].json_dict["root"]
-        else:
-            return result.tasks_output[task].json_dict
-    text = str(result.tasks_output[task])
+    output = result.tasks_output[task]
+    json_dict = output.json_dict
+    if json_dict is not None:
+        return json_dict.get("root", json_dict)
+    text = output_text(output)
     obj: Any
     if len(text) <= 2:
         return []
     try:
-        obj = json.loads(text)
-    except Exception:
-        fixed = _fix_json_text(text, schema)
-        obj = json.loads(fixed)
-    if "root" in obj:
+        obj = orjson.loads(text)
+    except orjson.JSONDecodeError:
+        obj = orjson.loads(_fix_json_text(text, schema))
+    # Only RootModel wrappers carry "root"; a membership test on a list or a
+    # string output would scan it (and index a string with "root")
+    if isinstance(obj, dict) and "root" in obj:
         return obj["root"]
     return obj
 
@@ -198,7 +269,7 @@ def load_json_object(result: TaskOutput, schema: str, task: int = -1) -> Dict[st
 def _fix_json_text(original_text: str, expected_schema: str) -> str:
     """
     Use the JSONFixerCrew to repair malformed JSON according to an expected schema.
-    Returns a JSON string that should be loadable by json.loads.
+    Returns a JSON string that should be loadable by orjson.loads.
     """
     result = JSONFixerCrew().crew().kickoff(
         inputs={
@@ -229,6 +300,51 @@ def process_path(base_path: str, path: str, sub_dir: str = "") -> Path:
     return ((Path(base_path) / sub_dir / path) if sub_dir else Path(base_path) / path).resolve()
 
 
+@lru_cache(maxsize=512)
+def _read_text(path: str, mtime_ns: int, size: int) -> str:
+    return Path(path).read_text(encoding="utf-8")
+
+
+def read_text_cached(path: Path) -> str:
+    """
+    Read a UTF-8 file, serving repeated reads of an unchanged file from memory.
+    Entries are keyed by modification time and size, so edits invalidate them.
+    """
+    st = path.stat()
+    return _read_text(str(path), st.st_mtime_ns, st.st_size)
+
+
+def _read_or_none(path: Path) -> Optional[str]:
+    try:
+        return path.read_text(encoding="utf-8")
+    except Exception:
+        return None
+
+
+def read_texts(paths: Iterable[Path], max_workers: Optional[int] = None) -> Iterator[Tuple[Path, Optional[str]]]:
+    """
+    Read UTF-8 files on a thread pool (reads release the GIL) and yield
+    ``(path, text)`` in input order; ``text`` is None for unreadable files.
+    At most ``max_workers`` reads run ahead of the consumer, so a lazy consumer
+    never holds more than that many files it has not asked for yet.
+    """
+    workers = max(1, max_workers or settings.IO_WORKERS)
+    if workers == 1:
+        for path in paths:
+            yield path, _read_or_none(path)
+        return
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        ahead: Deque[Tuple[Path, Future]] = deque()
+        for path in paths:
+            ahead.append((path, executor.submit(_read_or_none, path)))
+            if len(ahead) >= workers:
+                done_path, future = ahead.popleft()
+                yield done_path, future.result()
+        while ahead:
+            done_path, future = ahead.popleft()
+            yield done_path, future.result()
+
+
 def write_file_map(files: Dict[str, str], out_dir: str, sub_dir: str = "") -> List[Tuple[str, int]]:
     """
     Deterministically write files under out_dir with path traversal protection.
@@ -409,6 +525,93 @@ def apply_combined_unified_diffs(
         return False, str(exc)
 
 
+_HUNK_HEADER_RE = re.compile(r"^@@ -(\d+)(?:,(\d+))? \+\d+(?:,(\d+))? @@")
+
+
+def _parse_hunks(diff_text: str) -> Optional[List[Tuple[int, List[str], List[str]]]]:
+    """
+    Parse a unified diff into ``(old_start, old_lines, new_lines)`` hunks.
+    Returns None when the text has no hunks or a line cannot be interpreted.
+    While a hunk's line counts are not used up, "--- x" and "+++ x" are a
+    removed "-- x" and an added "++ x", not file headers.
+    """
+    hunks: List[Tuple[int, List[str], List[str]]] = []
+    current: Optional[Tuple[int, List[str], List[str]]] = None
+    old_left = new_left = 0
+    for line in diff_text.splitlines():
+        match = _HUNK_HEADER_RE.match(line)
+        if match:
+            current = (int(match.group(1)), [], [])
+            hunks.append(current)
+            old_left = int(match.group(2) or 1)
+            new_left = int(match.group(3) or 1)
+        elif (
+            current is None
+            or line.startswith(("diff ", "index "))
+            or (old_left <= 0 and new_left <= 0 and line.startswith(("--- ", "+++ ")))
+        ):
+            current = None
+        elif line.startswith("\\"):
+            continue
+        elif line.startswith("-"):
+            current[1].append(line[1:])
+            old_left -= 1
+        elif line.startswith("+"):
+            current[2].append(line[1:])
+            new_left -= 1
+        elif line.startswith(" ") or line == "":
+            current[1].append(line[1:])
+            current[2].append(line[1:])
+            old_left -= 1
+            new_left -= 1
+        else:
+            return None
+    return hunks or None
+
+
+def _locate_block(lines: List[str], block: List[str], hint: int) -> Optional[int]:
+    """Index where ``block`` starts in ``lines``: the hinted one, else the only match."""
+    size = len(block)
+    if 0 <= hint <= len(lines) - size and lines[hint:hint + size] == block:
+        return hint
+    matches = [i for i in range(len(lines) - size + 1) if lines[i:i + size] == block]
+    return matches[0] if len(matches) == 1 else None
+
+
+def apply_unified_diffs_to_text(original: str, diffs: List[str]) -> Optional[str]:
+    """
+    Apply unified diffs to ``original`` without an LLM.
+
+    Every hunk must match the original text (at its stated line or at a unique
+    place) and no two hunks may touch the same lines. Returns None otherwise,
+    so the caller can fall back to an LLM-based integration.
+    """
+    lines = original.splitlines()
+    edits: List[Tuple[int, int, List[str]]] = []
+    for diff_text in diffs:
+        hunks = _parse_hunks(diff_text) if isinstance(diff_text, str) else None
+        if hunks is None:
+            return None
+        for old_start, old_lines, new_lines in hunks:
+            if old_lines:
+                start = _locate_block(lines, old_lines, old_start - 1)
+            else:
+                start = old_start if 0 <= old_start <= len(lines) else None
+            if start is None:
+                return None
+            edits.append((start, start + len(old_lines), new_lines))
+    edits.sort(key=lambda e: (e[0], e[1]))
+    for (_, prev_end, _), (start, end, _) in zip(edits, edits[1:]):
+        if start < prev_end or (start == prev_end == end):
+            return None
+    for start, end, new_lines in reversed(edits):
+        lines[start:end] = new_lines
+    text = "\n".join(lines)
+    if lines and (original.endswith("\n") or not original):
+        text += "\n"
+    return text
+
+
 def extract_diffs_by_file(items: List[Dict[str, Any]]) -> Dict[str, List[str]]:
     """
     Normalize a list of diff items into a mapping path -> list[content_diff].
@@ -439,3 +642,40 @@ def collect_module_dirs_from_diffs_map(diffs_by_file: Dict[str, List[str]]) -> S
         except Exception:
             continue
     return modules
+
+
+# Explicit destination: "to <path>", optionally quoted or in backticks
+_PATH_TARGET_RE = re.compile(r"""\bto\s+[`'"]?([\w./\\-]+\.\w+)""")
+
+
+def guess_path_mapping(input_path: str, step: Dict[str, Any]) -> Dict[str, str]:
+    """
+    Resolve the destination of a rename/move/copy step without an LLM call.
+
+    Only an explicit "to <path>" in the step title or description is taken,
+    with the same suffix as the source and not existing yet. An absolute path
+    is used as-is; a bare file name is placed next to the source, except for
+    "Move file" steps, whose destination is another directory. Returns ``{}``
+    when there is no single such target, so the caller falls back to the
+    mapping crew.
+    """
+    src = Path(input_path)
+    text = f"{step.get('title') or ''}\n{step.get('description') or ''}"
+    is_move = (step.get("type") or "").strip() == "Move file"
+    candidates: Set[Path] = set()
+    for token in _PATH_TARGET_RE.findall(text):
+        candidate = Path(token.rstrip("."))
+        if candidate.suffix != src.suffix:
+            continue
+        if not candidate.is_absolute():
+            if is_move or len(candidate.parts) != 1:
+                continue
+            candidate = src.parent / candidate
+        if candidate != src:
+            candidates.add(candidate)
+    if len(candidates) != 1:
+        return {}
+    dst = candidates.pop()
+    if dst.exists():
+        return {}
+    return {str(src): str(dst)}
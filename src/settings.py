@@ -8,6 +8,10 @@ load_dotenv()
 
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
 
+# Crew step printing and per-crew log files (off by default: per-step I/O)
+CREW_VERBOSE = os.getenv("CREW_VERBOSE", "0") == "1"
+CREW_OUTPUT_LOG_FILE = os.getenv("CREW_OUTPUT_LOG_FILE", "0") == "1"
+
 # LLM models
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", "")
 MODEL_LIGHT = os.getenv("MODEL_LIGHT", "gpt-5-nano")
@@ -28,5 +32,27 @@ MAX_TEST_RUN_ATTEMPTS = int(os.getenv("MAX_TEST_RUN_ATTEMPTS", "3"))
 # Flow chunking limits
 MAX_CHARS = int(os.getenv("MAX_CHARS", "40000"))
 MAX_SCRIPTS = int(os.getenv("MAX_SCRIPTS", "10"))
+# Files summarized per FileSummariesCrew kickoff (output grows with each file)
+SUMMARIES_BATCH_FILES = int(os.getenv("SUMMARIES_BATCH_FILES", "8"))
 
 TOP_K_DOC_FILES = int(os.getenv("TOP_K_DOC_FILES", "9"))
+
+# Content-addressed per-file and per-module summaries ("" disables)
+SUMMARIES_CACHE_DIR = os.getenv("SUMMARIES_CACHE_DIR", os.path.join(DEFAULT_KNOWLEDGE_ROOT, "summaries_cache"))
+
+# Threads reading repository files concurrently
+IO_WORKERS = int(os.getenv("IO_WORKERS", "32"))
+
+# Maximum number of independent crew kickoffs run at the same time
+MAX_CONCURRENT_CREWS = int(os.getenv("MAX_CONCURRENT_CREWS", "8"))
+
+# Semantic response cache for crew kickoffs
+SEMANTIC_CACHE_ENABLED = os.getenv("SEMANTIC_CACHE_ENABLED", "1") == "1"
+SEMANTIC_CACHE_THRESHOLD = float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.92"))
+SEMANTIC_CACHE_TTL = int(os.getenv("SEMANTIC_CACHE_TTL", "3600"))  # seconds
+# Entries per partition above which lookups use an HNSW index (needs hnswlib)
+SEMANTIC_CACHE_HNSW_MIN_SIZE = int(os.getenv("SEMANTIC_CACHE_HNSW_MIN_SIZE", "10000"))
+# Entries saved at the end of a run and loaded on the next start ("" disables)
+SEMANTIC_CACHE_WARMUP_FILE = os.getenv(
+    "SEMANTIC_CACHE_WARMUP_FILE", os.path.join(DEFAULT_KNOWLEDGE_ROOT, "semantic_cache.jsonl")
+)
@@ -1,4 +1,5 @@
 from __future__ import annotations
+from functools import cached_property, lru_cache
 from typing import Iterable, List, Dict, Any, Optional, Union
 from pathlib import Path
 import os
@@ -127,11 +128,21 @@ class DocsRAG:
         self.manifest_path = (self.vectors_dir / "manifest.json").resolve()
         self.collection_name = collection_name
         self.vectors_dir.mkdir(parents=True, exist_ok=True)
-        # Chroma persistent client + collection
-        self._client: chromadb.PersistentClient = chromadb.PersistentClient(path=str(self.vectors_dir))
-        self._collection: Collection = self._client.get_or_create_collection(name=self.collection_name)
+
+    # -------- Lazy clients (built on first use) --------
+    @cached_property
+    def _client(self) -> chromadb.PersistentClient:
+        # Chroma persistent client
+        return chromadb.PersistentClient(path=str(self.vectors_dir))
+
+    @cached_property
+    def _collection(self) -> Collection:
+        return self._client.get_or_create_collection(name=self.collection_name)
+
+    @cached_property
+    def _openai(self) -> OpenAI:
         # OpenAI embeddings client
-        self._openai = OpenAI()
+        return OpenAI()
 
     # -------- Manifest helpers --------
     def _reset_store(self) -> None:
@@ -337,3 +348,16 @@ class DocsRAG:
         result['distances'] = res.get("distances", None)[0][:len(result['paths'])]
         result['documents'] = res.get("documents", None)[0][:len(result['paths'])]
         return result
+
+
+@lru_cache(maxsize=8)
+def _shared_docs_rag(repo_dir: str, docs_dir: str) -> DocsRAG:
+    return DocsRAG(repo_dir=Path(repo_dir), docs_dir=Path(docs_dir))
+
+
+def get_docs_rag(repo_dir: Path, docs_dir: Path) -> DocsRAG:
+    """
+    Return the process-wide DocsRAG of a repository docs directory, so the
+    Chroma client, collection and OpenAI client are opened once per process.
+    """
+    return _shared_docs_rag(str(Path(str(repo_dir)).resolve()), str(Path(str(docs_dir)).resolve()))
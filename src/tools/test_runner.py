@@ -4,6 +4,7 @@ from pydantic import BaseModel, Field
 from crewai.tools import BaseTool
 import subprocess
 from .. import settings
+from ..utils.files import walk_files
 import os
 import re
 import json
@@ -175,42 +176,26 @@ class DetectTestPresenceTool(BaseTool):
                 if not uses_unittest and unittest_import_pattern.search(text):
                     uses_unittest = True
 
-        # Phase 1: Process high-priority files first using glob (faster for specific patterns)
-        priority_patterns = [
-            "**/conftest.py",  # Strong pytest indicator
-            "**/test_*.py",  # Test files
-            "**/tests/**/*.py",  # Files in test directories
-            "**/test/**/*.py",  # Files in test directories (alternative naming)
-        ]
-
-        for pattern in priority_patterns:
+        def priority(path: Path) -> int:
+            """Strong indicators first: conftest.py, test_*.py, then test dirs."""
+            lower_name = path.name.lower()
+            if lower_name == "conftest.py":
+                return 0
+            if lower_name.startswith("test_"):
+                return 1
+            parts = path.relative_to(root).parts[:-1]
+            if "tests" in parts:
+                return 2
+            if "test" in parts:
+                return 3
+            return 4
+
+        # One pruned walk (no virtualenvs, build or VCS dirs), scanned in
+        # priority order until both frameworks are found
+        for path in sorted(walk_files(root, (".py",), sort=False)[".py"], key=priority):
             if (uses_pytest and uses_unittest) or scanned >= max_scan:
                 break
-
-            for path in root.glob(pattern):
-                process_file(path)
-                if (uses_pytest and uses_unittest) or scanned >= max_scan:
-                    break
-
-        # Phase 2: If we haven't found both frameworks yet, scan remaining Python files
-        if not (uses_pytest and uses_unittest) and scanned < max_scan:
-            # Use glob to get all Python files, but limit scanning
-            processed_paths = set()  # Avoid processing same file twice
-
-            for path in root.glob("**/*.py"):
-                if (uses_pytest and uses_unittest) or scanned >= max_scan:
-                    break
-
-                if (
-                    path in processed_paths
-                    or path.name.lower().startswith("test_")  # Already processed
-                    or path.name.lower() == "conftest.py"  # Already processed
-                    or "test" in path.parts
-                ):  # Already processed
-                    continue
-
-                processed_paths.add(path)
-                process_file(path)
+            process_file(path)
 
         return json.dumps(
             {"pytest": bool(uses_pytest), "unittest": bool(uses_unittest)}
@@ -0,0 +1,41 @@
+from __future__ import annotations
+from pathlib import Path
+from typing import Any, Dict, Tuple, TypeVar
+import copy
+import os
+import threading
+
+import yaml
+
+
+T = TypeVar("T")
+
+_CONFIGS: Dict[Tuple[str, int], Any] = {}
+_CONFIGS_LOCK = threading.Lock()
+
+
+def load_yaml_cached(config_path: Path) -> Any:
+    """
+    ``yaml.safe_load`` of ``config_path``, parsed once per file version (path and
+    mtime). Callers get a copy: CrewBase replaces agent names and task contexts
+    with live objects inside the loaded config.
+    """
+    path = str(config_path)
+    key = (path, os.stat(path).st_mtime_ns)
+    with _CONFIGS_LOCK:
+        config = _CONFIGS.get(key)
+    if config is None:
+        with open(path, "r", encoding="utf-8") as file:
+            config = yaml.safe_load(file)
+        with _CONFIGS_LOCK:
+            _CONFIGS[key] = config
+    return copy.deepcopy(config)
+
+
+def cached_configs(cls: T) -> T:
+    """
+    Apply on top of ``@CrewBase``: agents/tasks YAML is parsed once per process
+    instead of on every crew instantiation.
+    """
+    cls.load_yaml = staticmethod(load_yaml_cached)  # type: ignore[attr-defined]
+    return cls
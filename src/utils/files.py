@@ -0,0 +1,67 @@
+from __future__ import annotations
+from pathlib import Path
+from typing import Dict, Iterable, List
+import os
+
+
+# Directories that never hold project sources or docs
+_SKIP_DIRS = frozenset({
+    ".git", ".hg", ".svn", "node_modules", "__pycache__",
+    ".venv", "venv", ".tox", ".nox", ".mypy_cache", ".pytest_cache", ".ruff_cache",
+    ".eggs",
+})
+
+# Usual build output folders, which may also be real package names
+_BUILD_DIRS = frozenset({"build", "dist"})
+
+
+def _holds_build_output(path: str) -> bool:
+    """True if ``path`` contains setuptools/wheel build artifacts."""
+    try:
+        with os.scandir(path) as entries:
+            return any(
+                (entry.name.startswith(("lib", "bdist")) and entry.is_dir(follow_symlinks=False))
+                or entry.name.endswith((".whl", ".tar.gz", ".egg"))
+                for entry in entries
+            )
+    except OSError:
+        return False
+
+
+def is_ignored_dir(parent: str, name: str, at_root: bool = False) -> bool:
+    """
+    True for a directory ``name`` under ``parent`` never worth descending into:
+    VCS, virtualenv and cache folders, egg metadata, and ``build``/``dist``
+    when they are not a package and hold build output or sit at the walk root.
+    """
+    if name in _SKIP_DIRS or name.endswith(".egg-info"):
+        return True
+    if name in _BUILD_DIRS:
+        path = os.path.join(parent, name)
+        if os.path.isfile(os.path.join(path, "__init__.py")):
+            return False
+        return at_root or _holds_build_output(path)
+    return False
+
+
+def walk_files(root: Path, suffixes: Iterable[str], sort: bool = True, prune: bool = True) -> Dict[str, List[Path]]:
+    """
+    Collect the files under ``root`` with each of ``suffixes`` in a single
+    directory walk, pruning VCS, virtualenv, build and cache directories
+    unless ``prune`` is False (for generated trees such as the summaries).
+    Returns suffix -> paths, each list sorted unless ``sort`` is False.
+    """
+    found: Dict[str, List[Path]] = {suffix: [] for suffix in suffixes}
+    top = os.fspath(root)
+    for dirpath, dirnames, filenames in os.walk(top):
+        if prune:
+            at_root = dirpath == top
+            dirnames[:] = [d for d in dirnames if not is_ignored_dir(dirpath, d, at_root)]
+        for name in filenames:
+            paths = found.get(os.path.splitext(name)[1])
+            if paths is not None:
+                paths.append(Path(dirpath, name))
+    if sort:
+        for paths in found.values():
+            paths.sort(key=str)
+    return found
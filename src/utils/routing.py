@@ -1,14 +1,33 @@
 from __future__ import annotations
+from functools import lru_cache
 from typing import Dict, Any
 from crewai import LLM
-from litellm import num_retries
 from .. import settings
 
 
-def llms(**kwargs: Any) -> Dict[str, LLM]:
-    """Return CrewAI LLM instances."""
+# Output cap of the light and medium tiers
+MAX_OUTPUT_TOKENS = 8000
+
+
+@lru_cache(maxsize=8)
+def _build_llms(**kwargs: Any) -> Dict[str, LLM]:
     return {
-        "light": LLM(model=settings.MODEL_LIGHT, max_tokens=8000, temperature=0.0, num_retries=3, **kwargs),
-        "medium": LLM(model=settings.MODEL_MEDIUM, max_tokens=8000, temperature=0.0, num_retries=3, **kwargs),
+        "light": LLM(model=settings.MODEL_LIGHT, max_tokens=MAX_OUTPUT_TOKENS, temperature=0.0, num_retries=3, **kwargs),
+        "medium": LLM(model=settings.MODEL_MEDIUM, max_tokens=MAX_OUTPUT_TOKENS, temperature=0.0, num_retries=3, **kwargs),
         "reasoning": LLM(model=settings.MODEL_REASONING, temperature=0.0, num_retries=3, **kwargs),
     }
+
+
+def llms(**kwargs: Any) -> Dict[str, LLM]:
+    """
+    Return CrewAI LLM instances.
+
+    Instances are built once per set of (hashable) kwargs and shared by every
+    crew in the process: do not mutate them, build a dedicated ``LLM`` instead.
+    """
+    return dict(_build_llms(**kwargs))
+
+
+def get_llm(kind: str) -> LLM:
+    """Return the shared LLM instance of a tier: "light", "medium" or "reasoning"."""
+    return _build_llms()[kind]
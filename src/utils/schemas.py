@@ -0,0 +1,50 @@
+from __future__ import annotations
+from typing import Any, Dict, Tuple
+import copy
+import threading
+
+from pydantic import BaseModel, ConfigDict
+
+
+_SCHEMAS: Dict[Tuple[Any, ...], Dict[str, Any]] = {}
+_SCHEMAS_LOCK = threading.Lock()
+
+
+class CachedSchemaMixin:
+    """
+    Memoize ``model_json_schema`` for output models.
+
+    Output models never change at runtime, so the JSON schema CrewAI asks for on
+    every task execution is generated once per model and argument set. Callers
+    get a copy, so mutating it does not corrupt the cache.
+
+    Validators are built on first use rather than at import: most flow runs
+    only exercise a few of the output models they import.
+    """
+
+    model_config = ConfigDict(defer_build=True)
+
+    @classmethod
+    def model_json_schema(cls, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+        try:
+            key = (cls, args, tuple(sorted(kwargs.items())))
+            hash(key)
+        except TypeError:
+            return super().model_json_schema(*args, **kwargs)  # type: ignore[misc]
+        with _SCHEMAS_LOCK:
+            schema = _SCHEMAS.get(key)
+        if schema is None:
+            schema = super().model_json_schema(*args, **kwargs)  # type: ignore[misc]
+            with _SCHEMAS_LOCK:
+                _SCHEMAS[key] = schema
+        return copy.deepcopy(schema)
+
+
+class FrozenModel(BaseModel):
+    """
+    Base for output records: they are built once from the LLM's JSON and only
+    read afterwards, so instances are immutable. Like the output models, their
+    validators are built on first use.
+    """
+
+    model_config = ConfigDict(frozen=True, defer_build=True)
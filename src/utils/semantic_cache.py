@@ -0,0 +1,467 @@
+from __future__ import annotations
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+import hashlib
+import json
+import threading
+import time
+
+import numpy as np
+import orjson
+from crewai import Crew, CrewOutput
+from openai import OpenAI
+
+try:  # optional: approximate search for large partitions
+    import hnswlib
+except ImportError:  # pragma: no cover - linear scan fallback
+    hnswlib = None
+
+from .. import settings
+
+
+# Embedding models have a bounded context; keep head and tail of long prompts.
+_MAX_EMBED_CHARS = 16000
+
+# Inputs per embeddings request
+_EMBED_BATCH_SIZE = 128
+
+# Lookup outcomes, also used as keys of ``SemanticTaskCache.stats``
+HIT_L1 = "HIT-L1"
+HIT_L2 = "HIT-L2"
+MISS = "MISS"
+
+
+def _canonical_value(value: Any) -> Any:
+    if isinstance(value, str):
+        lines = value.replace("\r\n", "\n").split("\n")
+        return "\n".join(line.rstrip() for line in lines).rstrip("\n")
+    if isinstance(value, dict):
+        return {str(k): _canonical_value(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_canonical_value(v) for v in value]
+    return value
+
+
+def canonicalize(prompt: str) -> bytes:
+    """
+    Normalize a prompt for exact matching: JSON is re-serialized with sorted
+    keys, and in every string line endings become "\\n" and trailing whitespace
+    is dropped. Leading whitespace is kept (indentation is significant in code).
+    """
+    stripped = prompt.strip()
+    if stripped[:1] in ("{", "["):
+        try:
+            return orjson.dumps(_canonical_value(orjson.loads(stripped)), option=orjson.OPT_SORT_KEYS)
+        except Exception:
+            pass
+    return _canonical_value(prompt).encode("utf-8")
+
+
+@dataclass
+class CacheLookup:
+    """
+    Result of a cache lookup. On a miss it carries the prompt digest and the
+    computed embedding so the caller can store the fresh response without
+    hashing or embedding the prompt twice.
+    """
+
+    partition: str
+    prompt: str
+    digest: bytes = b""
+    embedding: Optional[np.ndarray] = None
+    response: Any = None
+    status: str = MISS
+
+    @property
+    def hit(self) -> bool:
+        return self.response is not None
+
+
+def _quantize(vec: np.ndarray) -> Tuple[np.ndarray, float]:
+    """Symmetric int8 quantization with a per-vector scale."""
+    peak = float(np.max(np.abs(vec))) if vec.size else 0.0
+    scale = peak / 127.0 if peak else 1.0
+    return np.round(vec / scale).astype(np.int8), scale
+
+
+@dataclass
+class _Partition:
+    # Embeddings are stored as int8 rows with one float32 scale per row (4x
+    # smaller than float32); similarity is computed in int32 and rescaled.
+    vecs: np.ndarray = field(default_factory=lambda: np.empty((0, 0), dtype=np.int8))
+    scales: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.float32))
+    prompts: List[str] = field(default_factory=list)
+    responses: List[Any] = field(default_factory=list)
+    timestamps: List[float] = field(default_factory=list)
+    # HNSW index over the rows (labels are row numbers), built past a size threshold
+    index: Any = None
+
+
+class SemanticTaskCache:
+    """
+    Two-layer in-memory cache of crew outputs.
+
+    L1 is an LRU map keyed by the SHA-256 of the exact prompt, so retries and
+    re-runs never pay for an embedding. Lookups made with ``semantic=False``
+    stop there. L2 entries are grouped in partitions
+    (one per crew configuration: task templates, agent roles and models) and
+    matched by cosine similarity of the embedded prompt, with a linear scan or,
+    past ``hnsw_min_size`` entries and when hnswlib is installed, an HNSW
+    index. A lookup is a hit when the best match is at least ``threshold``
+    similar and younger than ``ttl`` seconds. Outcomes are counted in
+    ``stats`` by status.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.92,
+        ttl: float = 3600,
+        l1_size: int = 1024,
+        hnsw_min_size: int = 10_000,
+    ) -> None:
+        self.threshold = threshold
+        self.ttl = ttl
+        self.l1_size = l1_size
+        self.hnsw_min_size = hnsw_min_size
+        self.stats: Counter = Counter()
+        self._lock = threading.Lock()
+        # digest -> (response, timestamp, partition, prompt); the last two are
+        # kept for exact-only entries, which have no L2 row to persist from
+        self._l1: OrderedDict[bytes, Tuple[Any, float, Optional[str], Optional[str]]] = OrderedDict()
+        self._partitions: Dict[str, _Partition] = {}
+        self._client: Optional[OpenAI] = None
+
+    # -------- Embeddings --------
+    @staticmethod
+    def _truncate(text: str) -> str:
+        if len(text) > _MAX_EMBED_CHARS:
+            half = _MAX_EMBED_CHARS // 2
+            text = text[:half] + text[-half:]
+        return text
+
+    def embed_many(self, texts: List[str], batch_size: int = _EMBED_BATCH_SIZE) -> np.ndarray:
+        """Embed ``texts`` with one request per batch; rows are L2-normalized."""
+        if self._client is None:
+            self._client = OpenAI()
+        rows: List[List[float]] = []
+        for i in range(0, len(texts), batch_size):
+            chunk = [self._truncate(t) for t in texts[i:i + batch_size]]
+            data = self._client.embeddings.create(model=settings.EMBEDDING_MODEL, input=chunk).data
+            rows.extend(d.embedding for d in sorted(data, key=lambda d: d.index))
+        vecs = np.asarray(rows, dtype=np.float32)
+        norms = np.linalg.norm(vecs, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return vecs / norms
+
+    def _embed(self, text: str) -> np.ndarray:
+        return self.embed_many([text])[0]
+
+    # -------- Lookup / store --------
+    @staticmethod
+    def _digest(partition: str, prompt: str) -> bytes:
+        h = hashlib.sha256(partition.encode("utf-8"))
+        h.update(b"\0")
+        h.update(canonicalize(prompt))
+        return h.digest()
+
+    def _l1_put(
+        self, digest: bytes, response: Any, ts: float, partition: Optional[str] = None, prompt: Optional[str] = None
+    ) -> None:
+        self._l1[digest] = (response, ts, partition, prompt)
+        self._l1.move_to_end(digest)
+        while len(self._l1) > self.l1_size:
+            self._l1.popitem(last=False)
+
+    def get(self, partition: str, prompt: str, semantic: bool = True) -> CacheLookup:
+        """
+        Return the cached response for ``prompt``: first an exact L1 match, then,
+        if ``semantic``, the most similar prompt in ``partition``. Embedding
+        failures are treated as misses without embedding.
+        """
+        lookup = CacheLookup(partition=partition, prompt=prompt, digest=self._digest(partition, prompt))
+        now = time.time()
+        with self._lock:
+            cached = self._l1.get(lookup.digest)
+            if cached is not None and now - cached[1] <= self.ttl:
+                self._l1.move_to_end(lookup.digest)
+                lookup.response, lookup.status = cached[0], HIT_L1
+                self.stats[HIT_L1] += 1
+                return lookup
+        if not semantic:
+            self.stats[MISS] += 1
+            return lookup
+        try:
+            lookup.embedding = self._embed(prompt)
+        except Exception:
+            self.stats[MISS] += 1
+            return lookup
+        with self._lock:
+            store = self._partitions.get(partition)
+            if store is not None and store.responses:
+                best, score = self._search(store, lookup.embedding, now)
+                if best >= 0 and score >= self.threshold:
+                    lookup.response, lookup.status = store.responses[best], HIT_L2
+                    self._l1_put(lookup.digest, lookup.response, store.timestamps[best])
+            self.stats[lookup.status] += 1
+        return lookup
+
+    def _search(self, store: _Partition, embedding: np.ndarray, now: float) -> Tuple[int, float]:
+        """Best live row of ``store`` and its cosine similarity (-1 if none)."""
+        if store.index is not None:
+            k = min(8, len(store.responses))
+            labels, dists = store.index.knn_query(embedding, k=k)
+            for label, dist in zip(labels[0], dists[0]):
+                if now - store.timestamps[int(label)] <= self.ttl:
+                    return int(label), 1.0 - float(dist)
+            return -1, -1.0
+        q, q_scale = _quantize(embedding)
+        dots = np.einsum("ij,j->i", store.vecs, q, dtype=np.int32)
+        scores = dots.astype(np.float32) * store.scales * np.float32(q_scale)
+        ages = now - np.asarray(store.timestamps)
+        scores[ages > self.ttl] = -1.0
+        best = int(np.argmax(scores))
+        return best, float(scores[best])
+
+    def _index_rows(self, store: _Partition, start: int) -> None:
+        """Add rows ``start:`` to the partition's HNSW index, creating it when the
+        partition reaches ``hnsw_min_size``."""
+        n = len(store.responses)
+        if hnswlib is None or n < self.hnsw_min_size:
+            store.index = None
+            return
+        if store.index is None:
+            store.index = hnswlib.Index(space="cosine", dim=store.vecs.shape[1])
+            store.index.init_index(max_elements=2 * n, ef_construction=200, M=16)
+            store.index.set_ef(64)
+            start = 0
+        elif n > store.index.get_max_elements():
+            store.index.resize_index(2 * n)
+        rows = store.vecs[start:].astype(np.float32) * store.scales[start:, np.newaxis]
+        store.index.add_items(rows, np.arange(start, n))
+
+    def put(self, lookup: CacheLookup, response: Any) -> None:
+        """
+        Store ``response`` for a missed lookup, dropping expired entries. Lookups
+        without an embedding (exact-only or failed) are stored in L1 only.
+        """
+        if response is None:
+            return
+        now = time.time()
+        with self._lock:
+            if lookup.embedding is not None:
+                self._l1_put(lookup.digest, response, now)
+                self._l2_put(lookup, response, now)
+            else:
+                self._l1_put(lookup.digest, response, now, lookup.partition, lookup.prompt)
+
+    def _l2_put(self, lookup: CacheLookup, response: Any, now: float, ts: Optional[float] = None) -> None:
+        store = self._partitions.setdefault(lookup.partition, _Partition())
+        keep = [i for i, ts in enumerate(store.timestamps) if now - ts <= self.ttl]
+        # Indexed partitions skip expired rows at query time and are only
+        # compacted (and re-indexed) once a quarter of them has expired.
+        stale = len(store.timestamps) - len(keep)
+        if stale and (store.index is None or stale * 4 >= len(store.timestamps)):
+            store.vecs = store.vecs[keep]
+            store.scales = store.scales[keep]
+            store.prompts = [store.prompts[i] for i in keep]
+            store.responses = [store.responses[i] for i in keep]
+            store.timestamps = [store.timestamps[i] for i in keep]
+            # Row numbers changed: the index is rebuilt below
+            store.index = None
+        q, scale = _quantize(lookup.embedding)
+        row = q[np.newaxis, :]
+        store.vecs = row if not store.responses else np.vstack([store.vecs, row])
+        store.scales = np.append(store.scales, np.float32(scale)).astype(np.float32)
+        store.prompts.append(lookup.prompt)
+        store.responses.append(response)
+        store.timestamps.append(now if ts is None else ts)
+        self._index_rows(store, len(store.responses) - 1)
+
+    def warmup(self, entries: Iterable[Tuple[str, str, Any, bool, float]]) -> int:
+        """
+        Pre-populate the cache with ``(partition, prompt, response, semantic, ts)``
+        entries, keeping their original timestamps: entries already older than
+        ``ttl`` are dropped. Semantic entries are embedded in batched requests;
+        the others only go to L1. Returns the number stored.
+        """
+        now = time.time()
+        entries = [e for e in entries if e[2] is not None and now - e[4] <= self.ttl]
+        if not entries:
+            return 0
+        semantic = [e for e in entries if e[3]]
+        vecs = self.embed_many([e[1] for e in semantic]) if semantic else []
+        with self._lock:
+            for partition, prompt, response, is_semantic, ts in entries:
+                if not is_semantic:
+                    self._l1_put(self._digest(partition, prompt), response, ts, partition, prompt)
+            for (partition, prompt, response, _, ts), vec in zip(semantic, vecs):
+                lookup = CacheLookup(
+                    partition=partition,
+                    prompt=prompt,
+                    digest=self._digest(partition, prompt),
+                    embedding=vec,
+                )
+                self._l1_put(lookup.digest, response, ts)
+                self._l2_put(lookup, response, now, ts)
+        return len(entries)
+
+    def entries(self) -> Iterator[Tuple[str, str, Any, bool, float]]:
+        """Yield the live ``(partition, prompt, response, semantic, ts)`` entries."""
+        now = time.time()
+        with self._lock:
+            snapshot = [
+                (partition, store.prompts[i], store.responses[i], True, ts)
+                for partition, store in self._partitions.items()
+                for i, ts in enumerate(store.timestamps)
+                if now - ts <= self.ttl
+            ]
+            snapshot.extend(
+                (partition, prompt, response, False, ts)
+                for response, ts, partition, prompt in self._l1.values()
+                if partition is not None and now - ts <= self.ttl
+            )
+        yield from snapshot
+
+    def clear(self) -> None:
+        with self._lock:
+            self._l1.clear()
+            self._partitions.clear()
+            self.stats.clear()
+
+
+_CACHE: Optional[SemanticTaskCache] = None
+_CACHE_LOCK = threading.Lock()
+
+
+def get_semantic_cache() -> SemanticTaskCache:
+    """Return the process-wide cache configured from settings."""
+    global _CACHE
+    with _CACHE_LOCK:
+        if _CACHE is None:
+            _CACHE = SemanticTaskCache(
+                threshold=settings.SEMANTIC_CACHE_THRESHOLD,
+                ttl=settings.SEMANTIC_CACHE_TTL,
+                hnsw_min_size=settings.SEMANTIC_CACHE_HNSW_MIN_SIZE,
+            )
+        return _CACHE
+
+
+# CrewOutput.pydantic holds instances of arbitrary models that cannot be
+# rebuilt from JSON; json_dict and raw carry the same data.
+_DUMP_EXCLUDE: Dict[str, Any] = {"pydantic": True, "tasks_output": {"__all__": {"pydantic"}}}
+
+_WARMED_UP = False
+
+
+def warmup_once() -> None:
+    """
+    Load the entries saved by ``save_warmup`` into the process-wide cache.
+    Only the first call does any work; a missing or unreadable file is ignored.
+    """
+    global _WARMED_UP
+    with _CACHE_LOCK:
+        if _WARMED_UP:
+            return
+        _WARMED_UP = True
+    path = Path(settings.SEMANTIC_CACHE_WARMUP_FILE)
+    if not settings.SEMANTIC_CACHE_ENABLED or not settings.SEMANTIC_CACHE_WARMUP_FILE or not path.is_file():
+        return
+    entries: List[Tuple[str, str, Any]] = []
+    try:
+        with path.open("r", encoding="utf-8") as fh:
+            for line in fh:
+                if not line.strip():
+                    continue
+                try:
+                    item = json.loads(line)
+                    entries.append((
+                        item["partition"],
+                        item["prompt"],
+                        CrewOutput.model_validate(item["output"]),
+                        item.get("semantic", True),
+                        # Entries saved without a timestamp count as expired
+                        float(item.get("ts", 0)),
+                    ))
+                except Exception:
+                    continue
+        get_semantic_cache().warmup(entries)
+    except Exception:
+        pass
+
+
+def save_warmup() -> None:
+    """Persist the live cache entries so the next process starts warm."""
+    if not settings.SEMANTIC_CACHE_ENABLED or not settings.SEMANTIC_CACHE_WARMUP_FILE:
+        return
+    path = Path(settings.SEMANTIC_CACHE_WARMUP_FILE)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("w", encoding="utf-8") as fh:
+            for partition, prompt, output, semantic, ts in get_semantic_cache().entries():
+                item = {
+                    "partition": partition,
+                    "prompt": prompt,
+                    "output": output.model_dump(mode="json", exclude=_DUMP_EXCLUDE),
+                    "semantic": semantic,
+                    "ts": ts,
+                }
+                fh.write(json.dumps(item, ensure_ascii=False) + "\n")
+    except Exception:
+        pass
+
+
+def _crew_signature(crew: Crew) -> str:
+    """
+    Hash the static part of a crew: task templates, agent roles and models.
+    Kickoff overwrites a task's description and expected output with the
+    interpolated text and keeps the templates aside; those are hashed, so a
+    reused crew stays in one partition.
+    """
+    parts: List[Dict[str, Any]] = []
+    for t in crew.tasks:
+        agent = getattr(t, "agent", None)
+        llm = getattr(agent, "llm", None)
+        parts.append({
+            "description": getattr(t, "_original_description", None) or t.description,
+            "expected_output": getattr(t, "_original_expected_output", None) or t.expected_output,
+            "role": getattr(agent, "role", None),
+            "model": getattr(llm, "model", None),
+        })
+    payload = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _is_deterministic(crew: Crew) -> bool:
+    """Only crews whose agents all sample at temperature 0 are cache-eligible."""
+    return all(getattr(getattr(a, "llm", None), "temperature", None) == 0 for a in crew.agents)
+
+
+def _serialize_inputs(inputs: Optional[Dict[str, Any]]) -> str:
+    return json.dumps(inputs or {}, sort_keys=True, ensure_ascii=False, default=str)
+
+
+class CachedCrew(Crew):
+    """
+    Crew whose kickoff is short-circuited by the process-wide semantic cache.
+    Drop-in replacement for ``Crew`` in ``@crew`` methods.
+
+    Only identical inputs are served from the cache unless ``semantic=True``:
+    crews that generate code, diffs or fixed JSON must never get the output of
+    a merely similar input. Opt in only where a near match is an acceptable
+    answer (e.g. selection crews).
+    """
+
+    semantic: bool = False
+
+    def kickoff(self, inputs: Optional[Dict[str, Any]] = None) -> CrewOutput:
+        if not settings.SEMANTIC_CACHE_ENABLED or not _is_deterministic(self):
+            return super().kickoff(inputs=inputs)
+        cache = get_semantic_cache()
+        lookup = cache.get(_crew_signature(self), _serialize_inputs(inputs), semantic=self.semantic)
+        if lookup.hit:
+            return lookup.response.model_copy(deep=True)
+        output = super().kickoff(inputs=inputs)
+        cache.put(lookup, output.model_copy(deep=True))
+        return output
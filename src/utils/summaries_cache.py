@@ -0,0 +1,73 @@
+from __future__ import annotations
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Optional
+import hashlib
+import os
+import tempfile
+
+import orjson
+
+from .. import settings
+
+
+_CONFIG_DIR = Path(__file__).resolve().parents[1] / "crews" / "summaries" / "config"
+
+# Task template that produces each kind of summary
+_TASK_CONFIGS = {
+    "file": "file_summaries_task.yaml",
+    "module": "module_task.yaml",
+}
+
+
+@lru_cache(maxsize=None)
+def _config_digest(kind: str) -> bytes:
+    """Hash of what shapes a summary besides its input: prompts and model."""
+    h = hashlib.blake2b(digest_size=16)
+    for name in ("agents.yaml", _TASK_CONFIGS[kind]):
+        h.update((_CONFIG_DIR / name).read_bytes())
+    h.update(settings.MODEL_LIGHT.encode("utf-8"))
+    return h.digest()
+
+
+def summary_key(kind: str, *parts: str) -> str:
+    """Content address of a ``kind`` ("file" or "module") summary of ``parts``."""
+    h = hashlib.blake2b(_config_digest(kind), digest_size=16)
+    for part in parts:
+        h.update(part.encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def _entry_path(key: str) -> Path:
+    return Path(settings.SUMMARIES_CACHE_DIR) / key[:2] / f"{key}.json"
+
+
+def load_summary(key: str) -> Optional[Dict[str, Any]]:
+    """Cached summary for ``key``, or None (also when the cache is disabled)."""
+    if not settings.SUMMARIES_CACHE_DIR:
+        return None
+    try:
+        data = orjson.loads(_entry_path(key).read_bytes())
+    except Exception:
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def store_summary(key: str, summary: Dict[str, Any]) -> None:
+    """Persist ``summary`` atomically; best-effort."""
+    if not settings.SUMMARIES_CACHE_DIR:
+        return
+    path = _entry_path(key)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(orjson.dumps(summary, default=str))
+            os.replace(tmp, path)
+        except Exception:
+            os.unlink(tmp)
+            raise
+    except Exception:
+        pass